@@ -19,6 +19,8 @@ from functools import partial
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+import PIL
+
 from .asset_manager import AssetManager
 from .config_manager import ConfigManager
 from .message_bus import MessageBus
@@ -244,6 +246,9 @@ async def run(argv: list[str] | None = None) -> int:
             renderer: RendererPlugin = plugin_manager.create(
                 GROUP_RENDERER, configured_renderer, **kwargs
             )
+            # Pillow-SIMD builds carry a ".postN" version suffix.
+            simd = " (SIMD build)" if "post" in PIL.__version__ else ""
+            logger.info(f"Rendering with Pillow {PIL.__version__}{simd}")
 
             screen_manager = ScreenManager(bus, plugin_manager, renderer, vessel_manager, cm=config_manager, asset_manager=asset_manager, data_dir=args.data_dir)
             await screen_manager.start()
@@ -1,6 +1,7 @@
 import asyncio
 from collections import defaultdict
 from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 _SHUTDOWN = object()
@@ -63,16 +64,46 @@ class MessageBus:
             Any: Messages published to the specified topic in the order received.
         """
 
-        q: asyncio.Queue[Any] = asyncio.Queue(maxsize=1000)
-        async with self._lock:
-            self._subs[topic].append(q)
-
-        try:
+        async with self._subscription(topic) as q:
             while True:
                 msg = await q.get()
                 if msg is _SHUTDOWN:
                     return
                 yield msg
+
+    async def subscribe_batches(self, topic: str) -> AsyncIterator[list[Any]]:
+        """
+        Subscribe to a topic and receive messages in batches.
+
+        Like subscribe(), but each wake-up drains everything already queued and
+        yields it as one list, in publish order. Subscribers that only need to
+        react once per burst (eg: to request a render) avoid waking per message.
+
+        Args:
+            topic (str): The name of the topic to subscribe to.
+
+        Yields:
+            list[Any]: One or more messages published since the previous batch.
+        """
+        async with self._subscription(topic) as q:
+            while True:
+                batch = [await q.get()]
+                while not q.empty():
+                    batch.append(q.get_nowait())
+                if any(msg is _SHUTDOWN for msg in batch):
+                    # shutdown() empties the queue before the sentinel goes in
+                    return
+                yield batch
+
+    @asynccontextmanager
+    async def _subscription(self, topic: str) -> AsyncIterator[asyncio.Queue[Any]]:
+        """Register a bounded queue (max size 1000) for topic, removing it on exit."""
+        q: asyncio.Queue[Any] = asyncio.Queue(maxsize=1000)
+        async with self._lock:
+            self._subs[topic].append(q)
+
+        try:
+            yield q
         finally:
             async with self._lock:
                 try:
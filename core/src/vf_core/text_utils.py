@@ -5,9 +5,13 @@ anchored text drawing and font metric helpers.
 """
 from __future__ import annotations
 
-from PIL import ImageDraw, ImageFont
+import datetime
+import time
+from functools import lru_cache
 
-__all__ = ["FONT_FLOOR", "split_two", "TextRenderingMixin"]
+from PIL import Image, ImageDraw, ImageFont
+
+__all__ = ["FONT_FLOOR", "clock_text", "split_two", "TextRenderingMixin"]
 
 FONT_FLOOR = 7  # never render a font smaller than this
 
@@ -25,6 +29,44 @@ def split_two(name: str) -> list[str]:
     return [name[:i], name[i + 1:]]
 
 
+def clock_text(fmt: str) -> str:
+    """The local time formatted with fmt, for minute-resolution displays.
+
+    Each format is rendered once per minute, so fmt must not include seconds.
+    """
+    return _clock_text(fmt, int(time.time() // 60))
+
+
+@lru_cache(maxsize=16)
+def _clock_text(fmt: str, minute: int) -> str:
+    return datetime.datetime.fromtimestamp(minute * 60).strftime(fmt)
+
+
+@lru_cache(maxsize=1024)
+def _text_advance(font: ImageFont.FreeTypeFont, text: str) -> int:
+    """Memoised advance width. Layouts measure the same labels, units and
+    truncation candidates every frame, and fonts are shared via AssetManager."""
+    return round(font.getlength(text))
+
+
+@lru_cache(maxsize=512)
+def _text_mask(
+    font: ImageFont.FreeTypeFont, text: str, anchor: str, fx: float, fy: float
+) -> tuple[Image.Image, int, int]:
+    """Coverage mask of text exactly as draw.text rasterises it at the sub-pixel
+    offset (fx, fy), plus the offset of the anchor point inside the mask.
+
+    Masthead, header and label strings repeat frame after frame, so blitting a
+    cached mask skips FreeType layout and rasterising for all but the first.
+    """
+    left, top, right, bottom = font.getbbox(text, anchor=anchor)
+    # One pixel of slack all round covers the sub-pixel shift.
+    ox, oy = max(0, 1 - left), max(0, 1 - top)
+    mask = Image.new("L", (ox + right + 2, oy + bottom + 2))
+    ImageDraw.Draw(mask).text((ox + fx, oy + fy), text, fill=255, font=font, anchor=anchor)
+    return mask, ox, oy
+
+
 class TextRenderingMixin:
     """Mixin: anchored text drawing and font metric helpers.
 
@@ -53,17 +95,22 @@ class TextRenderingMixin:
         """
         ascent, descent = font.getmetrics()
         bl_y = baseline_y if baseline_y is not None else y + ascent
-        draw.text(
-            (x, bl_y), text, font=font,
-            fill=fill if fill is not None else self._palette["text"],
-            anchor=self._ANCHORS[halign],
-        )
+        fill = fill if fill is not None else self._palette["text"]
+        anchor = self._ANCHORS[halign]
+        if x >= 0 and bl_y >= 0 and draw.fontmode == "L" and "\n" not in text:
+            ix, iy = int(x), int(bl_y)
+            mask, ox, oy = _text_mask(font, text, anchor, x - ix, bl_y - iy)
+            draw.bitmap((ix - ox, iy - oy), mask, fill=fill)
+        else:
+            draw.text((x, bl_y), text, font=font, fill=fill, anchor=anchor)
         return ascent + descent, bl_y, self._text_width(font, text)
 
     def _text_width(self, font: ImageFont.FreeTypeFont, text: str) -> int:
-        """Rendered width of text in pixels for the given font."""
-        left, _, right, _ = font.getbbox(text)
-        return right - left
+        """Rendered width of text in pixels for the given font.
+
+        Uses the advance length, which skips the bounding-box pass getbbox does.
+        """
+        return _text_advance(font, text)
 
     def _line_height(self, font: ImageFont.FreeTypeFont) -> int:
         a, d = font.getmetrics()
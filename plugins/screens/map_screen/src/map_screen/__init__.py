@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from contextlib import suppress
 from pathlib import Path
 from typing import Any
@@ -35,6 +36,11 @@ from .tiles import MapImageCache
 class MapScreen:
     """Screen to display a map of vessels which were recently observed."""
 
+    __slots__ = (
+        "_logger", "_bus", "_renderer", "_vessel_manager", "_in_topic", "_task",
+        "_bounds", "_layout", "_tiles", "_last_frame_sig", "_render_strategy",
+    )
+
     def __init__(
         self,
         *,
@@ -86,6 +92,7 @@ class MapScreen:
         )
         self._tiles.ensure()
         self._tiles.load()
+        self._last_frame_sig: tuple[list[dict], Any, int] | None = None
 
         interval = float(update_interval) if isinstance(update_interval, str) else update_interval
         self._render_strategy = PeriodicRenderStrategy(
@@ -101,22 +108,29 @@ class MapScreen:
             self._tiles.ensure()
             self._tiles.load()
 
+        # Another screen may have drawn over the shared canvas since our last frame.
+        self._last_frame_sig = None
         await self._render_strategy.start()
         self._render_strategy.request_render()
         self._task = asyncio.create_task(self._update_loop())
 
     async def deactivate(self) -> None:
         """Stop listening for updates and cancel pending work."""
+        # Stop rendering even if the update loop has already died, otherwise the
+        # strategy would keep drawing over the next screen.
+        await self._render_strategy.stop()
         if self._task and not self._task.done():
-            await self._render_strategy.stop()
             self._task.cancel()
             with suppress(asyncio.CancelledError):
                 await self._task
 
     async def _update_loop(self) -> None:
-        """Internal loop that receives update events and requests renders."""
+        """Internal loop that receives update events and requests renders.
+
+        Bursts of updates arrive as one batch and cost a single render request.
+        """
         try:
-            async for _ in self._bus.subscribe(self._in_topic):
+            async for _ in self._bus.subscribe_batches(self._in_topic):
                 self._render_strategy.request_render()
         except asyncio.CancelledError:
             raise
@@ -126,12 +140,28 @@ class MapScreen:
 
     # --- render ------------------------------------------------------------
     async def _render(self) -> None:
-        """Render the map of recently observed vessels via the layout."""
+        """Render the map of recently observed vessels via the layout.
+
+        Skipped when the vessels, map image and printed minute are unchanged.
+        VesselManager replaces a vessel's dict on every update rather than
+        mutating it, so the records and image are compared by identity.
+        """
         canvas = self._renderer.canvas
         is_portrait = canvas.width < canvas.height
         map_image = self._tiles.current(is_portrait)
         vessels = self._vessel_manager.get_recent_vessels()
+        sig = (vessels, map_image, int(time.time()) // 60)
+        last = self._last_frame_sig
+        if (
+            last is not None
+            and last[1] is map_image
+            and last[2] == sig[2]
+            and len(last[0]) == len(vessels)
+            and all(a is b for a, b in zip(last[0], vessels, strict=True))
+        ):
+            return
         await self._layout.render(map_image, vessels)
+        self._last_frame_sig = sig
 
 
 def get_config_schema() -> ConfigSchema:
@@ -11,13 +11,12 @@ expressed by shapes, fill-state and halo, never by just the colour.
 """
 from __future__ import annotations
 
-import datetime
 import math
 import time
 from typing import Any
 
 from PIL import Image, ImageDraw, ImageFont
-from vf_core.text_utils import TextRenderingMixin
+from vf_core.text_utils import TextRenderingMixin, clock_text
 
 from .bounds import Bounds
 
@@ -45,6 +44,9 @@ class MapLayout(TextRenderingMixin):
         self._palette = renderer.palette
         self._bounds = bounds
 
+        # The renderer's canvas lives for the whole process, so one Draw serves
+        # every frame.
+        self._draw = ImageDraw.Draw(renderer.canvas)
         canvas_w, canvas_h = renderer.canvas.size
         self._scale = max(1.0, min(canvas_w, canvas_h) / 480)
         self._margin = self._px(18)
@@ -65,6 +67,15 @@ class MapLayout(TextRenderingMixin):
         self._dot_halo = max(1, self._px(1))  # subtler than the polygon halo
         self._label_gap = self._px(7)
 
+        # Per-marker styling, bound once rather than rebuilt for every vessel.
+        P = self._palette
+        self._halo_colour = P["foreground"]
+        self._moving_style = (P["accent"], P["line"], self._marker_outline)
+        self._moored_style = (P["foreground"], P["accent"], max(self._marker_outline, self._px(2)))
+        self._hull_min = (self.SHIP_MIN_LENGTH_PX * self._scale, self.SHIP_MIN_BEAM_PX * self._scale)
+        self._hull_max = (self.SHIP_MAX_LENGTH_PX * self._scale, self.SHIP_MAX_BEAM_PX * self._scale)
+        self._plate_cache: tuple[Image.Image | None, Image.Image] | None = None
+
     def _px(self, v: float) -> int:
         return max(1, round(v * self._scale))
 
@@ -102,23 +113,21 @@ class MapLayout(TextRenderingMixin):
     async def render(self, map_image: Image.Image | None, vessels: list[dict]) -> None:
         """Render the map of recently observed vessels inside the broadsheet frame."""
         canvas = self._renderer.canvas
-        draw = ImageDraw.Draw(canvas)
+        draw = self._draw
         W, H = canvas.size
         layout = self._layout(W, H)
         plate = layout["plate"]
         px0, py0, px1, py1 = plate
         plate_w, plate_h = px1 - px0, py1 - py0
 
-        self._renderer.clear()
+        # Only the frame around the plate needs clearing: the pasted plate and
+        # its border overwrite every pixel inside it.
+        self._clear_frame(draw, W, H, plate)
 
         # --- build the map plate as a sub-image: markers/labels drawn here are
         #     hard-clipped to the plate by the paste, so nothing overlaps the
         #     border or draws off the edge. ---
-        if map_image is not None:
-            plate_img = (map_image.resize((plate_w, plate_h))
-                         if map_image.size != (plate_w, plate_h) else map_image.copy())
-        else:
-            plate_img = Image.new("RGB", (plate_w, plate_h), self._palette["background"])
+        plate_img = self._plate_base(map_image, (plate_w, plate_h), canvas.mode).copy()
         pdraw = ImageDraw.Draw(plate_img)
 
         markers: list[tuple[dict[str, Any], tuple[float, float]]] = []
@@ -141,19 +150,42 @@ class MapLayout(TextRenderingMixin):
 
         await self._renderer.flush()
 
+    def _clear_frame(self, draw: ImageDraw.ImageDraw, W: int, H: int,
+                     plate: tuple[int, int, int, int]) -> None:
+        """Fill the canvas outside the plate rect (border included) with the
+        background: the masthead band, footer band and side margins."""
+        x0, y0, x1, y1 = plate
+        bg = self._palette["background"]
+        draw.rectangle([0, 0, W - 1, y0 - 1], fill=bg)
+        draw.rectangle([0, y1 + 1, W - 1, H - 1], fill=bg)
+        draw.rectangle([0, y0, x0 - 1, y1], fill=bg)
+        draw.rectangle([x1 + 1, y0, W - 1, y1], fill=bg)
+
+    def _plate_base(self, map_image: Image.Image | None, size: tuple[int, int],
+                    mode: str) -> Image.Image:
+        """The undecorated plate (map scaled to size, or background) in the canvas
+        mode. Built once per map image so each frame only copies it."""
+        cached = self._plate_cache
+        if cached is not None and cached[0] is map_image and cached[1].size == size:
+            return cached[1]
+        if map_image is not None:
+            base = map_image.resize(size) if map_image.size != size else map_image
+            base = base.convert(mode)
+        else:
+            base = Image.new(mode, size, self._palette["background"])
+        self._plate_cache = (map_image, base)
+        return base
+
     def _draw_masthead(self, draw: ImageDraw.ImageDraw, W: int, layout: dict, count: int) -> None:
         """Masthead band: brand / issue no / date, rule, and vessel-count eyebrow."""
         f = self._fonts
         x0, x1 = self._margin, W - self._margin
         text = self._palette["text"]
         line = self._palette["line"]
-        # opaque band so text never fights the map
-        draw.rectangle([0, 0, W, layout["plate"][1] - self._px(6)], fill=self._palette["background"])
-        now = datetime.datetime.now()
         self._draw_text(draw, x0, layout["brand_y"], "VESSEL FRAME", f["brand"], fill=text)
         self._draw_text(draw, (x0 + x1) // 2, layout["brand_y"], ISSUE_NO, f["meta"],
                         halign="centre", fill=text)
-        self._draw_text(draw, x1, layout["brand_y"], now.strftime("%d %b  %H:%M"),
+        self._draw_text(draw, x1, layout["brand_y"], clock_text("%d %b  %H:%M"),
                         f["meta"], halign="right", fill=text)
         draw.line([(x0, layout["rule1_y"]), (x1, layout["rule1_y"])], line, self._thick)
         self._draw_text(draw, x0, layout["eyebrow_y"], f"{count} VESSELS ON THE WATER",
@@ -166,9 +198,6 @@ class MapLayout(TextRenderingMixin):
         line = self._palette["line"]
         attr_h = self._line_height(f["attr"])
         ry, ty = layout["rule2_y"], layout["footer_text_y"]
-        # opaque band from just above the rule to the bottom edge
-        band_bottom = ty + attr_h + self._margin
-        draw.rectangle([0, ry - self._px(4), W, band_bottom], fill=self._palette["background"])
         draw.line([(x0, ry), (x1, ry)], line, self._thick)
         cy = ty + attr_h // 2
         self._legend_hull(draw, x0 + self._px(6), cy, True)
@@ -223,14 +252,11 @@ class MapLayout(TextRenderingMixin):
     def _fill_outline(self, moving: bool) -> tuple[str, str, int]:
         """(fill, outline, outline_width) for a marker: solid accent when under
         way, hollow (accent outline) when moored."""
-        P = self._palette
-        if moving:
-            return P["accent"], P["line"], self._marker_outline
-        return P["foreground"], P["accent"], max(self._marker_outline, self._px(2))
+        return self._moving_style if moving else self._moored_style
 
     def _polygon_with_halo(self, draw: ImageDraw.ImageDraw, pts: list, moving: bool) -> None:
-        P = self._palette
-        draw.polygon(pts, fill=P["foreground"], outline=P["foreground"], width=self._halo_w)
+        halo = self._halo_colour
+        draw.polygon(pts, fill=halo, outline=halo, width=self._halo_w)
         fill, outline, w = self._fill_outline(moving)
         draw.polygon(pts, fill=fill, outline=outline, width=w)
 
@@ -250,10 +276,9 @@ class MapLayout(TextRenderingMixin):
 
     def _draw_dot(self, draw: ImageDraw.ImageDraw, x: float, y: float, moving: bool) -> None:
         """Dot marker (no heading available) with a subtle halo + fill-state."""
-        P = self._palette
         r, halo = self._dot_r, self._dot_halo
         draw.ellipse([x - r - halo, y - r - halo, x + r + halo, y + r + halo],
-                     fill=P["foreground"])
+                     fill=self._halo_colour)
         fill, outline, w = self._fill_outline(moving)
         draw.ellipse([x - r, y - r, x + r, y + r], fill=fill, outline=outline, width=w)
 
@@ -261,8 +286,8 @@ class MapLayout(TextRenderingMixin):
                    beam: int, heading: float, mpp: float, moving: bool) -> None:
         """Pointed hull, oriented by heading, sized to-scale but never below the
         minimum. Vessels with no dimensions draw at the minimum hull size."""
-        min_l, max_l = self.SHIP_MIN_LENGTH_PX * self._scale, self.SHIP_MAX_LENGTH_PX * self._scale
-        min_b, max_b = self.SHIP_MIN_BEAM_PX * self._scale, self.SHIP_MAX_BEAM_PX * self._scale
+        min_l, min_b = self._hull_min
+        max_l, max_b = self._hull_max
         if length > 0 and beam > 0:
             length_px = max(min_l, min(max_l, length / mpp))
             beam_px = max(min_b, min(max_b, beam / mpp))
@@ -284,6 +309,7 @@ class MapLayout(TextRenderingMixin):
         plate-relative (the caller composites the plate sub-image)."""
         now = time.time()
         f = self._fonts["label"]
+        text = self._palette["text"]
         x0, y0, x1, y1 = 0, 0, plate_w, plate_h
         th = self._line_height(f)
         ordered = sorted(
@@ -307,7 +333,7 @@ class MapLayout(TextRenderingMixin):
             if any(self._overlaps(box, b) for b in placed):
                 continue
             placed.append(box)
-            self._halo_text(draw, lx, ly, name, f, self._palette["text"])
+            self._halo_text(draw, lx, ly, name, f, text)
 
     @staticmethod
     def _overlaps(a: tuple, b: tuple) -> bool:
@@ -322,7 +348,7 @@ class MapLayout(TextRenderingMixin):
     def _halo_text(self, draw: ImageDraw.ImageDraw, x: float, y: float, text: str,
                    font: ImageFont.FreeTypeFont, fill: str) -> None:
         """Text with an 8-direction foreground halo so it reads over any map."""
-        halo = self._palette["foreground"]
+        halo = self._halo_colour
         o = max(1, self._px(1))
         for dx in (-o, 0, o):
             for dy in (-o, 0, o):
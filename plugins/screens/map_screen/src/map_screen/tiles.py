@@ -138,24 +138,31 @@ class MapImageCache:
         return width, height, ""
 
     def _is_valid_image(self, path: Path) -> bool:
-        """True if the file exists and can be fully decoded. Deletes if it's corrupted."""
+        """True if the file exists and its structure checks out. Deletes it if
+        it's corrupted. Pixels aren't decoded here; load() does that once."""
         if not path.exists():
             return False
         try:
             with Image.open(path) as img:
-                img.load()
+                img.verify()
             return True
         except Exception:
-            self._logger.warning(f"Cached map image is corrupted, deleting: {path.name}")
-            path.unlink(missing_ok=True)
+            self._discard_corrupt(path)
             return False
 
+    def _discard_corrupt(self, path: Path) -> None:
+        self._logger.warning(f"Cached map image is corrupted, deleting: {path.name}")
+        path.unlink(missing_ok=True)
+
     def _load_map_image(self, name: str) -> Image.Image | None:
-        """Load a cached map image (RGB) for compositing."""
+        """Load a cached map image (RGB) for compositing, decoding it once."""
         path = self._cache_dir / f"{name}_{self._cache_key}"
-        if not self._is_valid_image(path):
+        if not path.exists():
             self._logger.warning(f"Map image not found: {path.name}")
             return None
-        with Image.open(path) as img:
-            img.load()
-            return img.convert("RGB")
+        try:
+            with Image.open(path) as img:
+                return img.convert("RGB")
+        except Exception:
+            self._discard_corrupt(path)
+            return None
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from contextlib import suppress
 from typing import Any
 
@@ -19,6 +20,7 @@ from vf_core.render_strategies import PeriodicRenderStrategy
 from vf_core.vessel_manager import VesselManager
 
 from .layouts import select_layout
+from .layouts.base import LIVE_MAX
 
 # Layout profile is chosen by the panel's short side (min of width/height, px):
 # at/above PROFILE_LARGE_MIN the dense two-column "large" layout is used, below
@@ -29,6 +31,9 @@ PROFILE_STANDARD_MIN = 480
 # Upper bound on vessels pulled per render. The layout shows as many as fit.
 FETCH_LIMIT = 500
 
+# (records, clock minute, printed ages) for the frame-skip check.
+_FrameSig = tuple[tuple[dict, ...], int, tuple[int, ...]]
+
 
 class TableScreen:
     """Screen showing a broadsheet table of recently observed vessels.
@@ -38,6 +43,12 @@ class TableScreen:
     and delegates drawing to it.
     """
 
+    __slots__ = (
+        "_logger", "_bus", "_renderer", "_vessel_manager", "_asset_manager", "_in_topic",
+        "_task", "_palette", "_render_strategy", "_orientation", "_profile", "_layout",
+        "_scale", "_last_frame_sig", "_drawing",
+    )
+
     def __init__(
         self,
         *,
@@ -70,6 +81,9 @@ class TableScreen:
         self._profile = self._select_profile(canvas_w, canvas_h)
         self._layout = None
         self._scale = 0.0
+        self._last_frame_sig: _FrameSig | None = None
+        # The layout's draw, running in the default executor, while one is in flight.
+        self._drawing: asyncio.Future[None] | None = None
 
     def _select_profile(self, w: int, h: int) -> str:
         """Pick a layout profile from the panel's short side."""
@@ -86,23 +100,35 @@ class TableScreen:
         if self._task and not self._task.done():
             return
 
+        # Another screen may have drawn over the shared canvas since our last frame.
+        self._last_frame_sig = None
         await self._render_strategy.start()
         self._render_strategy.request_render()
         self._task = asyncio.create_task(self._update_loop())
 
     async def deactivate(self) -> None:
         """Stop listening for updates and cancel pending work."""
+        # Stop rendering even if the update loop has already died, otherwise the
+        # strategy would keep drawing over the next screen.
+        await self._render_strategy.stop()
         if self._task and not self._task.done():
-            await self._render_strategy.stop()
-
             self._task.cancel()
             with suppress(asyncio.CancelledError):
                 await self._task
 
+        # Stopping the strategy doesn't stop a draw already handed to a worker.
+        # Let it finish before the next screen starts on the shared canvas.
+        if self._drawing is not None:
+            with suppress(Exception):
+                await self._drawing
+
     async def _update_loop(self) -> None:
-        """Internal loop that receives update events and requests renders."""
+        """Internal loop that receives update events and requests renders.
+
+        Bursts of updates arrive as one batch and cost a single render request.
+        """
         try:
-            async for _ in self._bus.subscribe(self._in_topic):
+            async for _ in self._bus.subscribe_batches(self._in_topic):
                 self._render_strategy.request_render()
         except asyncio.CancelledError:
             raise
@@ -120,14 +146,64 @@ class TableScreen:
             orientation=self._orientation,
         )
 
+    def _frame_signature(self, vessels: list[dict]) -> _FrameSig:
+        """What the frame shows: the vessel records, the printed clock minute and
+        each vessel's age at the resolution it is printed (seconds while live,
+        whole minutes after). The recency glyphs and counts change on those same
+        boundaries, since LIVE_MAX and RECENT_MAX are whole minutes."""
+        now = int(time.time())
+        ages = []
+        for v in vessels:
+            age = max(now - v.get("ts", 0), 0)
+            # Live ages are non-negative seconds, older ones negated minutes.
+            ages.append(age if age < LIVE_MAX else -(age // 60))
+        return tuple(vessels), now // 60, tuple(ages)
+
+    def _frame_unchanged(self, sig: _FrameSig) -> bool:
+        """Whether sig matches the last frame drawn.
+
+        VesselManager replaces a vessel's dict on every update rather than
+        mutating it, so the same dict objects in the same order mean the same
+        rows, even when several updates land within one second of ``ts``.
+        """
+        if self._last_frame_sig is None:
+            return False
+        records, clock, ages = sig
+        last_records, last_clock, last_ages = self._last_frame_sig
+        return (
+            clock == last_clock
+            and ages == last_ages
+            and len(records) == len(last_records)
+            and all(a is b for a, b in zip(records, last_records, strict=True))
+        )
+
     async def _render(self) -> None:
-        """Render the table of most recently observed vessels via the layout."""
+        """Render the table of most recently observed vessels via the layout.
+
+        Skipped when nothing visible has changed since the last frame. The PIL
+        drawing runs in the default executor so the event loop keeps servicing
+        the bus and other plugins meanwhile; only the flush runs on the loop.
+        """
         vessels = self._vessel_manager.get_recent_vessels(limit=FETCH_LIMIT)
+        sig = self._frame_signature(vessels)
+        if self._frame_unchanged(sig):
+            return
         total = len(vessels)
-        layout = self._make_layout()
-        await layout.render(vessels, total)
-        self._layout = layout
-        self._scale = layout._scale
+        # Orientation and profile are fixed for the panel, so the layout (and
+        # the Draw it holds on the canvas) is built once and reused.
+        if self._layout is None:
+            self._layout = self._make_layout()
+            self._scale = self._layout._scale
+        loop = asyncio.get_running_loop()
+        self._drawing = loop.run_in_executor(None, self._layout.draw, vessels, total)
+        try:
+            # Shielded so a cancelled render still leaves deactivate a draw to wait on.
+            await asyncio.shield(self._drawing)
+        finally:
+            if self._drawing.done():
+                self._drawing = None
+        await self._renderer.flush()
+        self._last_frame_sig = sig
 
 
 def get_config_schema() -> ConfigSchema:
@@ -3,16 +3,17 @@
 It holds the render context, the per-panel scaleing (every tier scales from a
 per-profile reference width) and the shared vessel-formatting / recency / masthead
 / legend / stat / outline helpers that keep the tiers consistent.
-Concrete layouts implement render(vessels, total).
+Concrete layouts implement draw(vessels, total).
 """
 from __future__ import annotations
 
-import datetime
-from typing import Any
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any, NamedTuple
 
-from PIL import ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont
 from vf_core.marine_utils import nav_status_short
-from vf_core.text_utils import TextRenderingMixin
+from vf_core.text_utils import TextRenderingMixin, clock_text
 
 # Design reference widths per profile (the panel's long edge), per orientation.
 # Fonts/spacing scale from these so each resolution renders at scale 1
@@ -27,6 +28,41 @@ LIVE_MAX = 60
 RECENT_MAX = 300
 
 
+@lru_cache(maxsize=256)
+def _main_type(ship_type_name: str) -> str:
+    """'Tanker - Hazardous A' -> 'tanker'. 'vessel' when unknown/reserved.
+
+    Memoised as there are only a few dozen AIS type names and every row of
+    every frame looks one up.
+    """
+    raw = ship_type_name.split(" - ", 1)[0].strip().lower()
+    return raw if raw not in ("", "unknown", "reserved", "other") else "vessel"
+
+
+class FleetStats(NamedTuple):
+    """Stats-bar figures for the large tiers, gathered in one pass."""
+    live: int  # heard under LIVE_MAX ago
+    recent: int  # heard LIVE_MAX..RECENT_MAX ago
+    underway: int  # moving faster than 0.5 kn
+    longest: dict | None  # first vessel with the greatest length
+    max_len: int  # that length in m, at least 1 so it can scale outlines
+
+
+class VesselRow(NamedTuple):
+    """One table row's values, read from the vessel dict and formatted once."""
+    name: str  # display name, before truncation
+    type: str
+    status: str  # short nav status, "" when unknown
+    subtitle: str  # "type  ·  status"
+    speed: str | None  # formatted knots while moving, else None
+    course: float
+    recency: str
+    age: str
+    length: int
+    beam: int
+    identifier: str
+
+
 class TableLayout(TextRenderingMixin):
     """Render context, scale machinery + shared table helpers.
 
@@ -45,9 +81,17 @@ class TableLayout(TextRenderingMixin):
         self._renderer = renderer
         self._asset_manager = asset_manager
         self._palette = renderer.palette
+        # Colours used per row, bound once.
+        self._accent = self._palette["accent"]
+        self._ink = self._palette["text"]
+        self._outline_colour = self._palette["line"]
         self._profile = profile
         self._orientation = orientation
 
+        # The renderer's canvas lives for the whole process, so one Draw serves
+        # every frame this layout renders.
+        self._draw = ImageDraw.Draw(renderer.canvas)
+        self._legend_strips: dict[tuple, Image.Image] = {}
         canvas_w, _ = renderer.canvas.size
         refs = REF_WIDTH_LANDSCAPE if orientation == "landscape" else REF_WIDTH
         self._scale = canvas_w / refs[profile]
@@ -55,10 +99,18 @@ class TableLayout(TextRenderingMixin):
         self._gap = max(1, round(16 * self._scale))
         self._gap_s = max(1, round(5 * self._scale))
 
-    async def render(self, vessels: list[dict], total: int) -> None:
-        """Draw the vessel table to the canvas."""
+    def draw(self, vessels: list[dict], total: int) -> None:
+        """Draw the vessel table to the canvas.
+
+        Plain PIL work with no awaits, so the screen can run it off the event loop.
+        """
         raise NotImplementedError
 
+    async def render(self, vessels: list[dict], total: int) -> None:
+        """Draw the vessel table and flush it to the display."""
+        self.draw(vessels, total)
+        await self._renderer.flush()
+
     def _px(self, v: float) -> int:
         return max(1, round(v * self._scale))
 
@@ -72,8 +124,7 @@ class TableLayout(TextRenderingMixin):
 
     def _vessel_type(self, vessel: dict) -> str:
         """Main ship type, lowercased. 'vessel' when unknown/reserved."""
-        raw = (vessel.get("ship_type_name") or "").split(" - ", 1)[0].strip().lower()
-        return raw if raw not in ("", "unknown", "reserved", "other") else "vessel"
+        return _main_type(vessel.get("ship_type_name") or "")
 
     def _vessel_status(self, vessel: dict) -> str:
         """Short nav-status word. Derive 'under way' from speed if status absent."""
@@ -88,6 +139,44 @@ class TableLayout(TextRenderingMixin):
     def _vessel_beam(self, vessel: dict) -> int:
         return vessel.get("port", 0) + vessel.get("starboard", 0)
 
+    def _prepare_rows(self, vessels: list[dict], now: float) -> Iterator[VesselRow]:
+        """Pull and format every per-row field, lazily, so a layout that stops
+        at a screenful never formats the vessels below it."""
+        for v in vessels:
+            ts = v.get("ts", 0)
+            sp = v.get("speed", 0)
+            vtype, status = self._vessel_type(v), self._vessel_status(v)
+            yield VesselRow(
+                name=self._vessel_name(v),
+                type=vtype,
+                status=status,
+                subtitle=f"{vtype}  ·  {status}" if status else vtype,
+                speed=f"{sp:g}" if sp > 0 else None,
+                course=v.get("course", 0),
+                recency=self._recency(now, ts),
+                age=self._age_text(now, ts),
+                length=self._vessel_length(v),
+                beam=self._vessel_beam(v),
+                identifier=v.get("identifier", ""),
+            )
+
+    def _fleet_stats(self, vessels: list[dict], now: float) -> FleetStats:
+        """Recency counts, under-way count and longest vessel in a single walk."""
+        live = recent = underway = 0
+        longest, longest_len = None, -1
+        for v in vessels:
+            age = now - v.get("ts", 0)
+            if age < LIVE_MAX:
+                live += 1
+            elif age < RECENT_MAX:
+                recent += 1
+            if v.get("speed", 0) > 0.5:
+                underway += 1
+            length = self._vessel_length(v)
+            if length > longest_len:
+                longest, longest_len = v, length
+        return FleetStats(live, recent, underway, longest, max(longest_len, 0) or 1)
+
     def _age_text(self, now: float, ts: float) -> str:
         """Compact 'time since last heard': now / 22s / 5m / 2h."""
         a = int(now - ts)
@@ -108,20 +197,33 @@ class TableLayout(TextRenderingMixin):
 
     # --- drawing helpers ---------------------------------------------------
     def _truncate(self, font: ImageFont.FreeTypeFont, text: str, max_w: int) -> str:
-        """Trim with a trailing ellipsis so the text fits within max_w px."""
+        """Trim with a trailing ellipsis so the text fits within max_w px.
+
+        Candidates widen with the prefix length, so the longest one that fits
+        is found by bisection: O(log n) measurements rather than one per char.
+        """
         if self._text_width(font, text) <= max_w:
             return text
         ell = "…"
-        for i in range(len(text) - 1, 0, -1):
-            candidate = text[:i].rstrip() + ell
+        best = ell
+        lo, hi = 1, len(text) - 1
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            candidate = text[:mid].rstrip() + ell
             if self._text_width(font, candidate) <= max_w:
-                return candidate
-        return ell
+                best, lo = candidate, mid + 1
+            else:
+                hi = mid - 1
+        return best
+
+    def _glyph_dy(self, font: ImageFont.FreeTypeFont) -> int:
+        """Row top to the middle of a capital's ink, where the recency glyph sits."""
+        return (self._ink_top(font, "M") + self._ink_bottom(font, "M")) // 2
 
     def _draw_glyph(self, draw: ImageDraw.ImageDraw, x_left: int, cy: int,
                     kind: str, size: int) -> None:
         """Recency marker: filled square (live), empty square (recent), dot (old)."""
-        accent = self._palette["accent"]
+        accent = self._accent
         top = cy - size // 2
         if kind == "live":
             draw.rectangle([x_left, top, x_left + size, top + size], fill=accent)
@@ -131,7 +233,7 @@ class TableLayout(TextRenderingMixin):
         else:
             r = max(1, self._line_w + 1)
             cx = x_left + size // 2
-            draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=self._palette["text"])
+            draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=self._ink)
 
     def _draw_masthead(self, draw: ImageDraw.ImageDraw, x0: int, x1: int, y: int,
                        brand_f: ImageFont.FreeTypeFont, meta_f: ImageFont.FreeTypeFont,
@@ -141,25 +243,42 @@ class TableLayout(TextRenderingMixin):
         stacked_date: True draws time over date on two right-aligned lines (large
         tier). False draws a single 'dd Mon HH:MM' line (compact/standard).
         """
-        now = datetime.datetime.now()
         self._draw_text(draw, x0, y, "VESSEL FRAME", brand_f)
         self._draw_text(draw, (x0 + x1) // 2, y, ISSUE_NO, meta_f, halign="centre")
         if stacked_date:
-            self._draw_text(draw, x1, y, now.strftime("%H:%M"), meta_f, halign="right")
-            self._draw_text(draw, x1, y + self._line_height(meta_f), now.strftime("%d %b %Y"),
+            self._draw_text(draw, x1, y, clock_text("%H:%M"), meta_f, halign="right")
+            self._draw_text(draw, x1, y + self._line_height(meta_f), clock_text("%d %b %Y"),
                        meta_f, halign="right")
             return y + max(self._line_height(brand_f), 2 * self._line_height(meta_f))
-        self._draw_text(draw, x1, y, now.strftime("%d %b  %H:%M"), meta_f, halign="right")
+        self._draw_text(draw, x1, y, clock_text("%d %b  %H:%M"), meta_f, halign="right")
         return y + self._line_height(brand_f)
 
     def _draw_legend(self, draw: ImageDraw.ImageDraw, x0: int, y: int,
                      legend_f: ImageFont.FreeTypeFont, glyph: int,
                      short: bool = False) -> None:
-        """Recency legend: Filled square <1 min, empty square 1-5 min, dot if older (left-aligned)."""
+        """Recency legend: Filled square <1 min, empty square 1-5 min, dot if older (left-aligned).
+
+        The legend never changes, so it is drawn once into a background strip
+        which later frames paste.
+        """
+        key = (legend_f, glyph, short)
+        strip = self._legend_strips.get(key)
+        if strip is None:
+            labels = ("<1m", "1-5m", "older") if short else ("<1 min", "1-5 min", "older")
+            w = (3 * (glyph + self._gap_s) + 2 * self._gap
+                 + sum(self._text_width(legend_f, t) for t in labels) + self._gap_s)
+            strip = Image.new(self._renderer.canvas.mode, (w, self._line_height(legend_f)),
+                              self._palette["background"])
+            self._paint_legend(ImageDraw.Draw(strip), 0, 0, legend_f, glyph, labels)
+            self._legend_strips[key] = strip
+        self._renderer.canvas.paste(strip, (x0, y))
+
+    def _paint_legend(self, draw: ImageDraw.ImageDraw, x0: int, y: int,
+                      legend_f: ImageFont.FreeTypeFont, glyph: int,
+                      labels: tuple[str, str, str]) -> None:
         P = self._palette
         gap = self._gap
         cy = y + self._line_height(legend_f) // 2
-        labels = ("<1m", "1-5m", "older") if short else ("<1 min", "1-5 min", "older")
         lx = x0
         top = cy - glyph // 2
         draw.rectangle([lx, top, lx + glyph, top + glyph], fill=P["accent"])
@@ -201,4 +320,4 @@ class TableLayout(TextRenderingMixin):
             (x_left, cy - B / 2), (x_left + L - nose, cy - B / 2), (x_left + L, cy),
             (x_left + L - nose, cy + B / 2), (x_left, cy + B / 2),
         ]
-        draw.polygon(pts, outline=self._palette["line"], width=self._line_w)
+        draw.polygon(pts, outline=self._outline_colour, width=self._line_w)
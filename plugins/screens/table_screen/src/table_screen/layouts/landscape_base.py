@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import math
 
-from .base import TableLayout
+from .base import TableLayout, VesselRow
 
 COLS = 2  # 2 columns for all sizes. Outline stays a large-tier feature
 
@@ -15,7 +15,8 @@ COLS = 2  # 2 columns for all sizes. Outline stays a large-tier feature
 class LandscapeTableLayout(TableLayout):
     """Common landscape helper: balanced, column-major chunking."""
 
-    def _balanced_chunks(self, vessels: list[dict], capacity: int) -> tuple[list[list[dict]], int]:
+    def _balanced_chunks(self, vessels: list[VesselRow],
+                         capacity: int) -> tuple[list[list[VesselRow]], int]:
         """Split vessels across COLS columns, balanced (equal height) and
         column-major (most-recent down the first column, then the next).
 
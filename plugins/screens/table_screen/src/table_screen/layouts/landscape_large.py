@@ -7,18 +7,17 @@ from __future__ import annotations
 
 import time
 
-from PIL import ImageDraw
 from vf_core.marine_utils import compass
 
-from .landscape_base import LandscapeTableLayout
+from .landscape_base import COLS, LandscapeTableLayout
 
 
 class LandscapeLarge(LandscapeTableLayout):
     """Two-column broadsheet layout for large landscape panels (13")."""
 
-    async def render(self, vessels: list[dict], total: int) -> None:
+    def draw(self, vessels: list[dict], total: int) -> None:
         canvas = self._renderer.canvas
-        draw = ImageDraw.Draw(canvas)
+        draw = self._draw
         W, H = canvas.size
         px = self._px
         P = self._palette
@@ -57,18 +56,16 @@ class LandscapeLarge(LandscapeTableLayout):
         self._draw_text(draw, x0, y, "IN RANGE RIGHT NOW", f_eyebrow)
         y += self._line_height(f_eyebrow) + px(10)
         lh, _, _ = self._draw_text(draw, x0, y, f"{total} vessels", f_hero)
-        if vessels:
-            live = sum(1 for v in vessels if now - v.get("ts", 0) < 60)
-            recent = sum(1 for v in vessels if 60 <= now - v.get("ts", 0) < 300)
-            underway = sum(1 for v in vessels if v.get("speed", 0) > 0.5)
-            longest = max(vessels, key=self._vessel_length)
+        stats = self._fleet_stats(vessels, now)
+        longest = stats.longest
+        if longest is not None:
             sfonts = (f_slabel, f_snum, f_sunit, f_ssub)
             stat_x = x0 + cw // 2
             qcol = (x1 - stat_x) // 4
             sy = y + px(6)
-            self._stat(draw, stat_x + 0 * qcol, sy, "LIVE (<1 MIN)", str(live), "", None, sfonts)
-            self._stat(draw, stat_x + 1 * qcol, sy, "RECENT (1–5 MIN)", str(recent), "", None, sfonts)
-            self._stat(draw, stat_x + 2 * qcol, sy, "UNDER WAY", str(underway), "", None, sfonts)
+            self._stat(draw, stat_x + 0 * qcol, sy, "LIVE (<1 MIN)", str(stats.live), "", None, sfonts)
+            self._stat(draw, stat_x + 1 * qcol, sy, "RECENT (1–5 MIN)", str(stats.recent), "", None, sfonts)
+            self._stat(draw, stat_x + 2 * qcol, sy, "UNDER WAY", str(stats.underway), "", None, sfonts)
             self._stat(draw, stat_x + 3 * qcol, sy, "LONGEST", str(self._vessel_length(longest)),
                        "m", self._vessel_name(longest), sfonts)
         y += lh + px(22)
@@ -87,12 +84,16 @@ class LandscapeLarge(LandscapeTableLayout):
         row_pitch = self._line_height(f_name) + self._line_height(f_sub) + px(18)
         head_h = self._line_height(f_colhead) + px(8) + px(14)
         capacity = max(1, (bottom_rule_y - band_top - head_h) // row_pitch)
-        chunks, _ = self._balanced_chunks(vessels, capacity)
-        max_len = max((self._vessel_length(v) for v in vessels), default=1) or 1
+        rows = list(self._prepare_rows(vessels[:capacity * COLS], now))
+        chunks, _ = self._balanced_chunks(rows, capacity)
+        max_len = stats.max_len
         glyph = px(14)
         cpad = px(8)
         fr = [0.40, 0.24, 0.13, 0.09, 0.14]  # vessel, outline, speed, crs, heard
 
+        glyph_dy = self._glyph_dy(f_name)
+        max_beam_px = self._line_height(f_name) * 0.85
+        kn_w = self._text_width(f_sp_unit, "kn")
         shown = 0
         for ci, cx0 in enumerate(cols_x):
             cx1 = cx0 + col_w
@@ -116,30 +117,27 @@ class LandscapeLarge(LandscapeTableLayout):
             draw.line([(cx0, yh), (cx1, yh)], line, thick)
             y = yh + px(14)
 
-            for v in chunks[ci]:
+            for row in chunks[ci]:
                 if y + row_pitch > bottom_rule_y:
                     break
-                name = self._truncate(f_name, self._vessel_name(v), name_max)
+                name = self._truncate(f_name, row.name, name_max)
                 name_lh, name_bl, _ = self._draw_text(draw, name_x, y, name, f_name)
-                cy = (y + self._ink_top(f_name, "M") + y + self._ink_bottom(f_name, "M")) // 2
-                self._draw_glyph(draw, cx0, cy, self._recency(now, v.get("ts", 0)), glyph)
-                self._outline(draw, out_x0, cy, self._vessel_length(v), self._vessel_beam(v),
-                              scale, max_beam_px=self._line_height(f_name) * 0.85)
-                sp = v.get("speed", 0)
-                if sp > 0:
-                    kn_w = self._text_width(f_sp_unit, "kn")
+                cy = y + glyph_dy
+                self._draw_glyph(draw, cx0, cy, row.recency, glyph)
+                self._outline(draw, out_x0, cy, row.length, row.beam,
+                              scale, max_beam_px=max_beam_px)
+                if row.speed:
                     self._draw_text(draw, speed_right, y, "kn", f_sp_unit, halign="right", baseline_y=name_bl)
-                    self._draw_text(draw, speed_right - kn_w - px(3), y, f"{sp:g}", f_speed,
+                    self._draw_text(draw, speed_right - kn_w - px(3), y, row.speed, f_speed,
                                     halign="right", baseline_y=name_bl)
-                    crs = compass(v.get("course", 0))
+                    crs = compass(row.course)
                 else:
                     self._draw_text(draw, speed_right, y, "-", f_speed, halign="right", baseline_y=name_bl)
                     crs = "-"
                 self._draw_text(draw, crs_x, y, crs, f_cell, baseline_y=name_bl)
-                self._draw_text(draw, cx1, y, self._age_text(now, v.get("ts", 0)), f_cell,
+                self._draw_text(draw, cx1, y, row.age, f_cell,
                                 halign="right", baseline_y=name_bl)
-                parts = [p for p in (self._vessel_type(v), self._vessel_status(v)) if p]
-                self._draw_text(draw, name_x, y + int(name_lh * 0.86), "  ·  ".join(parts), f_sub)
+                self._draw_text(draw, name_x, y + int(name_lh * 0.86), row.subtitle, f_sub)
                 y += row_pitch
                 shown += 1
 
@@ -147,5 +145,3 @@ class LandscapeLarge(LandscapeTableLayout):
         fy = bottom_rule_y + px(8)
         self._draw_legend(draw, x0, fy, f_legend, px(11))
         self._draw_text(draw, x1, fy, f"{shown} of {total} shown", f_legend, halign="right")
-
-        await self._renderer.flush()
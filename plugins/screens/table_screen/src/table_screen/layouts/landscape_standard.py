@@ -6,18 +6,16 @@ from __future__ import annotations
 
 import time
 
-from PIL import ImageDraw
-
-from .landscape_base import LandscapeTableLayout
+from .landscape_base import COLS, LandscapeTableLayout
 
 
 class LandscapeStandard(LandscapeTableLayout):
     """Two-column landscape list (compact + standard tiers)."""
 
-    async def render(self, vessels: list[dict], total: int) -> None:
+    def draw(self, vessels: list[dict], total: int) -> None:
         show_speed = self._profile == "standard"
         canvas = self._renderer.canvas
-        draw = ImageDraw.Draw(canvas)
+        draw = self._draw
         W, H = canvas.size
         px = self._px
         P = self._palette
@@ -62,9 +60,12 @@ class LandscapeStandard(LandscapeTableLayout):
         draw.line([(x0 + col_w + col_gap // 2, y_top),
                    (x0 + col_w + col_gap // 2, bottom_rule_y - px(6))], line, self._line_w)
 
-        chunks, _ = self._balanced_chunks(vessels, capacity)
+        rows = list(self._prepare_rows(vessels[:capacity * COLS], now))
+        chunks, _ = self._balanced_chunks(rows, capacity)
         glyph = px(10)
         tw = self._text_width(f_time, "00m")
+        glyph_dy = self._glyph_dy(f_name)
+        kn_w = self._text_width(f_sp_unit, "kn")
         shown = 0
         for ci, cx0 in enumerate(cols_x):
             cx1 = cx0 + col_w
@@ -76,11 +77,11 @@ class LandscapeStandard(LandscapeTableLayout):
                 speed_right = None
                 name_max = cx1 - tw - px(12) - name_x
             y = y_top
-            for v in chunks[ci]:
+            for row in chunks[ci]:
                 if y + row_pitch > bottom_rule_y:
                     break
-                self._land_row(draw, v, now, name_x, name_max, y, f_name, f_sub, f_time,
-                               f_speed, f_sp_unit, cx0, glyph, cx1, speed_right)
+                self._land_row(draw, row, name_x, name_max, y, f_name, f_sub, f_time,
+                               f_speed, f_sp_unit, kn_w, cx0, glyph, glyph_dy, cx1, speed_right)
                 y += row_pitch
                 shown += 1
 
@@ -89,26 +90,21 @@ class LandscapeStandard(LandscapeTableLayout):
         self._draw_legend(draw, x0, fy, f_legend, px(8), short=small)
         self._draw_text(draw, x1, fy, f"{shown} of {total} shown", f_legend, halign="right")
 
-        await self._renderer.flush()
-
-    def _land_row(self, draw, v, now, name_x, name_max, y, f_name, f_sub, f_time,
-                  f_speed, f_sp_unit, glyph_x, glyph, time_right, speed_right) -> None:
+    def _land_row(self, draw, row, name_x, name_max, y, f_name, f_sub, f_time,
+                  f_speed, f_sp_unit, kn_w, glyph_x, glyph, glyph_dy, time_right,
+                  speed_right) -> None:
         """One landscape list row: glyph - name - type-status subtitle - [speed] - heard."""
         px = self._px
-        name = self._truncate(f_name, self._vessel_name(v), name_max)
+        name = self._truncate(f_name, row.name, name_max)
         name_lh, name_bl, _ = self._draw_text(draw, name_x, y, name, f_name)
-        cy = (y + self._ink_top(f_name, "M") + y + self._ink_bottom(f_name, "M")) // 2
-        self._draw_glyph(draw, glyph_x, cy, self._recency(now, v.get("ts", 0)), glyph)
-        self._draw_text(draw, time_right, y, self._age_text(now, v.get("ts", 0)), f_time,
+        self._draw_glyph(draw, glyph_x, y + glyph_dy, row.recency, glyph)
+        self._draw_text(draw, time_right, y, row.age, f_time,
                         halign="right", baseline_y=name_bl)
         if speed_right is not None:
-            sp = v.get("speed", 0)
-            if sp > 0:
-                kn_w = self._text_width(f_sp_unit, "kn")
+            if row.speed:
                 self._draw_text(draw, speed_right, y, "kn", f_sp_unit, halign="right", baseline_y=name_bl)
-                self._draw_text(draw, speed_right - kn_w - px(3), y, f"{sp:g}", f_speed,
+                self._draw_text(draw, speed_right - kn_w - px(3), y, row.speed, f_speed,
                                 halign="right", baseline_y=name_bl)
             else:
                 self._draw_text(draw, speed_right, y, "-", f_speed, halign="right", baseline_y=name_bl)
-        parts = [p for p in (self._vessel_type(v), self._vessel_status(v)) if p]
-        self._draw_text(draw, name_x, y + int(name_lh * 0.78), "  ·  ".join(parts), f_sub)
+        self._draw_text(draw, name_x, y + int(name_lh * 0.78), row.subtitle, f_sub)
@@ -7,7 +7,6 @@ from __future__ import annotations
 
 import time
 
-from PIL import ImageDraw
 from vf_core.marine_utils import compass, mmsi_country
 
 from .base import TableLayout
@@ -22,9 +21,9 @@ COL_FRACTIONS = [0.34, 0.17, 0.16, 0.12, 0.09, 0.07, 0.05]
 class PortraitLarge(TableLayout):
     """Broadsheet table layout for large portrait panels (13")."""
 
-    async def render(self, vessels: list[dict], total: int) -> None:
+    def draw(self, vessels: list[dict], total: int) -> None:
         canvas = self._renderer.canvas
-        draw = ImageDraw.Draw(canvas)
+        draw = self._draw
         W, H = canvas.size
         px = self._px
         P = self._palette
@@ -69,15 +68,13 @@ class PortraitLarge(TableLayout):
         y += lh + px(24)
 
         # --- stats bar ---
-        live = sum(1 for v in vessels if now - v.get("ts", 0) < 60)
-        recent = sum(1 for v in vessels if 60 <= now - v.get("ts", 0) < 300)
-        underway = sum(1 for v in vessels if v.get("speed", 0) > 0.5)
-        longest = max(vessels, key=self._vessel_length) if vessels else None
+        stats = self._fleet_stats(vessels, now)
+        longest = stats.longest
         sfonts = (f_slabel, f_snum, f_sunit, f_ssub)
         qcol = cw // 4
-        self._stat(draw, x0 + 0 * qcol, y, "LIVE (<1 MIN)", str(live), "", None, sfonts)
-        self._stat(draw, x0 + 1 * qcol, y, "RECENT (1-5 MIN)", str(recent), "", None, sfonts)
-        self._stat(draw, x0 + 2 * qcol, y, "UNDER WAY", str(underway), "", None, sfonts)
+        self._stat(draw, x0 + 0 * qcol, y, "LIVE (<1 MIN)", str(stats.live), "", None, sfonts)
+        self._stat(draw, x0 + 1 * qcol, y, "RECENT (1-5 MIN)", str(stats.recent), "", None, sfonts)
+        self._stat(draw, x0 + 2 * qcol, y, "UNDER WAY", str(stats.underway), "", None, sfonts)
         if longest is not None:
             self._stat(draw, x0 + 3 * qcol, y, "LONGEST", str(self._vessel_length(longest)),
                        "m", self._vessel_name(longest), sfonts)
@@ -115,7 +112,7 @@ class PortraitLarge(TableLayout):
         y += px(18)
 
         # --- to-scale factor: longest vessel fills the outline column ---
-        max_len = max((self._vessel_length(v) for v in vessels), default=1) or 1
+        max_len = stats.max_len
         out_x0, out_x1, _ = col["outline"]
         scale = (out_x1 - out_x0 - px(30)) / max_len
 
@@ -124,36 +121,35 @@ class PortraitLarge(TableLayout):
         bottom_rule_y = H - margin - footer_h
         row_pitch = self._line_height(f_name) + self._line_height(f_country) + px(20)
         name_max = out_x0 - name_x - px(12)
+        glyph_dy = self._glyph_dy(f_name)
+        max_beam_px = self._line_height(f_name) * 0.85
+        kn_w = self._text_width(f_sp_unit, "kn")
 
         shown = 0
-        for v in vessels:
+        for row in self._prepare_rows(vessels, now):
             if y + row_pitch > bottom_rule_y:
                 break
-            name = self._truncate(f_name, self._vessel_name(v), name_max)
+            name = self._truncate(f_name, row.name, name_max)
             name_lh, name_bl, _ = self._draw_text(draw, name_x, y, name, f_name)
-            ink_top = y + self._ink_top(f_name, "M")
-            ink_bot = y + self._ink_bottom(f_name, "M")
-            cy = (ink_top + ink_bot) // 2
-            self._draw_glyph(draw, xs[0], cy, self._recency(now, v.get("ts", 0)), glyph)
+            cy = y + glyph_dy
+            self._draw_glyph(draw, xs[0], cy, row.recency, glyph)
             self._draw_text(draw, name_x, y + int(name_lh * 0.92),
-                       mmsi_country(v.get("identifier", "")) or "", f_country)
-            self._outline(draw, out_x0, cy, self._vessel_length(v), self._vessel_beam(v),
-                          scale, max_beam_px=self._line_height(f_name) * 0.85)
-            self._draw_text(draw, col["type"][0] + cpad, y, self._vessel_type(v), f_cell, baseline_y=name_bl)
-            self._draw_text(draw, col["status"][0] + cpad, y, self._vessel_status(v) or "-",
+                       mmsi_country(row.identifier) or "", f_country)
+            self._outline(draw, out_x0, cy, row.length, row.beam,
+                          scale, max_beam_px=max_beam_px)
+            self._draw_text(draw, col["type"][0] + cpad, y, row.type, f_cell, baseline_y=name_bl)
+            self._draw_text(draw, col["status"][0] + cpad, y, row.status or "-",
                        f_cell, baseline_y=name_bl)
-            speed = v.get("speed", 0)
             sp_right = col["speed"][1] - cpad
-            if speed > 0:
-                kn_w = self._text_width(f_sp_unit, "kn")
+            if row.speed:
                 self._draw_text(draw, sp_right, y, "kn", f_sp_unit, halign="right", baseline_y=name_bl)
-                self._draw_text(draw, sp_right - kn_w - px(3), y, f"{speed:g}", f_speed,
+                self._draw_text(draw, sp_right - kn_w - px(3), y, row.speed, f_speed,
                            halign="right", baseline_y=name_bl)
             else:
                 self._draw_text(draw, sp_right, y, "-", f_speed, halign="right", baseline_y=name_bl)
-            crs = compass(v.get("course", 0)) if speed > 0 else "-"
+            crs = compass(row.course) if row.speed else "-"
             self._draw_text(draw, col["crs"][0] + cpad, y, crs, f_cell, baseline_y=name_bl)
-            self._draw_text(draw, x1, y, self._age_text(now, v.get("ts", 0)), f_cell,
+            self._draw_text(draw, x1, y, row.age, f_cell,
                        halign="right", baseline_y=name_bl)
             y += row_pitch
             shown += 1
@@ -163,5 +159,3 @@ class PortraitLarge(TableLayout):
         fy = bottom_rule_y + px(8)
         self._draw_legend(draw, x0, fy, f_legend, px(11))
         self._draw_text(draw, x1, fy, f"{shown} of {total} shown", f_legend, halign="right")
-
-        await self._renderer.flush()
@@ -7,18 +7,16 @@ from __future__ import annotations
 
 import time
 
-from PIL import ImageDraw
-
 from .base import TableLayout
 
 
 class PortraitStandard(TableLayout):
     """Single-column portrait list (compact + standard tiers)."""
 
-    async def render(self, vessels: list[dict], total: int) -> None:
+    def draw(self, vessels: list[dict], total: int) -> None:
         show_speed = self._profile == "standard"
         canvas = self._renderer.canvas
-        draw = ImageDraw.Draw(canvas)
+        draw = self._draw
         W, H = canvas.size
         px = self._px
         P = self._palette
@@ -67,30 +65,26 @@ class PortraitStandard(TableLayout):
         else:
             name_max = x1 - tw - px(12) - name_x
         row_pitch = self._line_height(f_name) + self._line_height(f_sub) + px(10)
+        glyph_dy = self._glyph_dy(f_name)
+        kn_w = self._text_width(f_sp_unit, "kn")
 
         shown = 0
-        for v in vessels:
+        for row in self._prepare_rows(vessels, now):
             if y + row_pitch > bottom_rule_y:
                 break
-            name = self._truncate(f_name, self._vessel_name(v), name_max)
+            name = self._truncate(f_name, row.name, name_max)
             name_lh, name_bl, _ = self._draw_text(draw, name_x, y, name, f_name)
-            ink_top = y + self._ink_top(f_name, "M")
-            ink_bot = y + self._ink_bottom(f_name, "M")
-            self._draw_glyph(draw, x0, (ink_top + ink_bot) // 2,
-                             self._recency(now, v.get("ts", 0)), glyph)
-            self._draw_text(draw, time_right, y, self._age_text(now, v.get("ts", 0)), f_time,
+            self._draw_glyph(draw, x0, y + glyph_dy, row.recency, glyph)
+            self._draw_text(draw, time_right, y, row.age, f_time,
                        halign="right", baseline_y=name_bl)
             if show_speed:
-                speed = v.get("speed", 0)
-                if speed > 0:
-                    kn_w = self._text_width(f_sp_unit, "kn")
+                if row.speed:
                     self._draw_text(draw, speed_right, y, "kn", f_sp_unit, halign="right", baseline_y=name_bl)
-                    self._draw_text(draw, speed_right - kn_w - px(3), y, f"{speed:g}", f_speed,
+                    self._draw_text(draw, speed_right - kn_w - px(3), y, row.speed, f_speed,
                                halign="right", baseline_y=name_bl)
                 else:
                     self._draw_text(draw, speed_right, y, "-", f_speed, halign="right", baseline_y=name_bl)
-            parts = [p for p in (self._vessel_type(v), self._vessel_status(v)) if p]
-            self._draw_text(draw, name_x, y + int(name_lh * 0.78), "  ·  ".join(parts), f_sub)
+            self._draw_text(draw, name_x, y + int(name_lh * 0.78), row.subtitle, f_sub)
             y += row_pitch
             shown += 1
 
@@ -99,5 +93,3 @@ class PortraitStandard(TableLayout):
         fy = bottom_rule_y + px(6)
         self._draw_legend(draw, x0, fy, f_legend, px(8), short=small)
         self._draw_text(draw, x1, fy, f"{shown} of {total} shown", f_legend, halign="right")
-
-        await self._renderer.flush()
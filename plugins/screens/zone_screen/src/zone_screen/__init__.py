@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from contextlib import suppress
 from typing import Any
 
@@ -35,6 +36,13 @@ class ZoneScreen:
     and delegates drawing to it.
     """
 
+    __slots__ = (
+        "_logger", "_bus", "_renderer", "_vessel_manager", "_asset_manager", "_in_topic",
+        "_task", "_palette", "_current_vessel", "_last_frame_sig", "_render_strategy",
+        "_zone_name", "_zone_lat", "_zone_lon", "_heading_offset", "_orientation",
+        "_profile", "_layout", "_scale",
+    )
+
     def __init__(
         self,
         *,
@@ -60,6 +68,7 @@ class ZoneScreen:
         self._task: asyncio.Task[None] | None = None
         self._palette = renderer.palette
         self._current_vessel: dict[str, Any] | None = None
+        self._last_frame_sig: tuple[dict[str, Any] | None, int] | None = None
         self._render_strategy = PeriodicRenderStrategy(
             self._render, renderer.MIN_RENDER_INTERVAL + update_interval
         )
@@ -97,28 +106,38 @@ class ZoneScreen:
         if self._task and not self._task.done():
             return
 
+        self._last_frame_sig = None
         await self._render_strategy.start()
         self._render_strategy.request_render()
         self._task = asyncio.create_task(self._update_loop())
 
     async def deactivate(self) -> None:
         """Stop listening and cancel background work."""
+        # Stop rendering even if the update loop has already died, otherwise the
+        # strategy would keep drawing over the next screen.
+        await self._render_strategy.stop()
         if self._task and not self._task.done():
-            await self._render_strategy.stop()
-
             self._task.cancel()
             with suppress(asyncio.CancelledError):
                 await self._task
 
     async def _update_loop(self) -> None:
-        """Internal loop that receives zone events and requests renders."""
+        """Internal loop that receives zone events and requests renders.
+
+        Events queued during a burst arrive as one batch; only the latest valid
+        vessel in it is kept, for a single render request.
+        """
         try:
-            async for msg in self._bus.subscribe(self._in_topic):
-                vessel = msg.get("vessel")
+            async for batch in self._bus.subscribe_batches(self._in_topic):
                 self._logger.info("Zone Screen Update")
-
-                if vessel and self._is_valid_vessel(vessel):
-                    self._current_vessel = vessel
+                latest = None
+                for msg in batch:
+                    vessel = msg.get("vessel")
+                    if vessel and self._is_valid_vessel(vessel):
+                        latest = vessel
+
+                if latest is not None:
+                    self._current_vessel = latest
                     self._render_strategy.request_render()
         except asyncio.CancelledError:
             raise
@@ -159,15 +178,27 @@ class ZoneScreen:
         )
 
     async def _render(self) -> None:
-        """Render the current vessel via the layout for this panel."""
-        layout = self._make_layout()
-        layout._current_vessel = self._current_vessel
+        """Render the current vessel via the layout for this panel.
+
+        Skipped when the vessel and the printed minute (every layout shows the
+        clock) are unchanged. VesselManager publishes a fresh dict on every
+        update, so the vessel is compared by identity.
+        """
+        vessel = self._current_vessel
+        minute = int(time.time()) // 60
+        last = self._last_frame_sig
+        if last is not None and last[0] is vessel and last[1] == minute:
+            return
+        if self._layout is None:
+            self._layout = self._make_layout()
+        layout = self._layout
+        layout._current_vessel = vessel
         await layout.render()
-        self._layout = layout
         self._scale = getattr(layout, "_scale", 0.0)
+        self._last_frame_sig = (vessel, minute)
 
     def _min_layout_height(self) -> int:
-        """Delegate to the last-rendered layout's minimum (used by the survey)."""
+        """Delegate to the layout's minimum as last rendered (used by the survey)."""
         if self._layout is not None:
             return self._layout.min_height()
         return 0
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from PIL import ImageDraw
 from vf_core.text_utils import TextRenderingMixin
 
 
@@ -38,12 +39,34 @@ class ZoneLayout(TextRenderingMixin):
         self._zone_lon = zone_lon
         self._heading_offset = heading_offset
         self._profile = profile
+        # The renderer's canvas lives for the whole process, so one Draw serves
+        # every frame this layout renders.
+        self._draw = ImageDraw.Draw(renderer.canvas)
         self._current_vessel: dict[str, Any] | None = None
 
     async def render(self) -> None:
         """Draw the current vessel to the canvas."""
         raise NotImplementedError
 
+    @staticmethod
+    def _hrule(draw: ImageDraw.ImageDraw, x0: int, x1: int, y: int, fill: Any, width: int) -> None:
+        """Horizontal rule, drawn as a filled rectangle covering the same pixels as
+        draw.line would. Falls back to draw.line for float or reversed extents."""
+        if width > 0 and x0 < x1 and all(isinstance(v, int) for v in (x0, x1, y)):
+            top = y - (width - 1) // 2
+            draw.rectangle([x0, top, x1, top + width - 1], fill=fill)
+        else:
+            draw.line([(x0, y), (x1, y)], fill, width)
+
+    @staticmethod
+    def _vrule(draw: ImageDraw.ImageDraw, x: int, y0: int, y1: int, fill: Any, width: int) -> None:
+        """Vertical counterpart of _hrule."""
+        if width > 0 and y0 < y1 and all(isinstance(v, int) for v in (x, y0, y1)):
+            left = x - (width - 1) // 2
+            draw.rectangle([left, y0, left + width - 1, y1], fill=fill)
+        else:
+            draw.line([(x, y0), (x, y1)], fill, width)
+
     def min_height(self) -> int:
         """Minimum pixels this layout needs, overridden where a fit-guard applies."""
         return 0
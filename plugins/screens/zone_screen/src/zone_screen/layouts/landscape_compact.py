@@ -5,10 +5,7 @@ footer (MMSI / SPD / CRS). Self-sizing from a 600px design width.
 """
 from __future__ import annotations
 
-import datetime
-
-from PIL import ImageDraw
-from vf_core.text_utils import FONT_FLOOR, split_two
+from vf_core.text_utils import FONT_FLOOR, clock_text, split_two
 
 from .landscape_base import LandscapeLayout
 
@@ -19,7 +16,7 @@ class LandscapeCompact(LandscapeLayout):
     async def render(self):
         vessel = self._current_vessel
         canvas = self._renderer.canvas
-        draw = ImageDraw.Draw(canvas)
+        draw = self._draw
         W, H = canvas.size
         self._renderer.clear()
         if vessel is None:
@@ -32,7 +29,6 @@ class LandscapeCompact(LandscapeLayout):
             return max(1, round(v * s))
         am = self._asset_manager
         line = self._palette["line"]
-        now = datetime.datetime.now()
 
         f_brand = am.get_font("secondary", "SemiBold", px(15))
         f_light = am.get_font("secondary", "Regular", px(12))
@@ -49,7 +45,7 @@ class LandscapeCompact(LandscapeLayout):
         def fit_val(val, avail, mx, mn):
             f = self._fit_font("primary", "700", val, avail, mx, mn)
             def vw(t):
-                return f.getbbox(t)[2] - f.getbbox(t)[0]
+                return self._text_width(f, t)
             if vw(val) <= avail:
                 return f, val
             while val and vw(val + "…") > avail:
@@ -60,9 +56,9 @@ class LandscapeCompact(LandscapeLayout):
         y = pad
         self._draw_text(draw, x0, y, "VESSEL FRAME", f_brand)
         self._draw_text(draw, (x0 + x1) // 2, y, "No. 0183", f_light, halign="centre")
-        self._draw_text(draw, x1, y, now.strftime("%H:%M"), f_light, halign="right")
+        self._draw_text(draw, x1, y, clock_text("%H:%M"), f_light, halign="right")
         y += self._line_height(f_brand) + px(8)
-        draw.line([(x0, y), (x1, y)], line, thin)
+        self._hrule(draw, x0, x1, y, line, thin)
         header_rule_y = y
 
         # footer (bottom): MMSI / SPD / CRS, evenly spread
@@ -70,7 +66,7 @@ class LandscapeCompact(LandscapeLayout):
         footer_label_y = H - pad - flabel_h - px(5) - self._line_height(f_fval)
         footer_value_y = footer_label_y + flabel_h + px(5)
         footer_rule_y = footer_label_y - px(12)
-        draw.line([(x0, footer_rule_y), (x1, footer_rule_y)], line, thin)
+        self._hrule(draw, x0, x1, footer_rule_y, line, thin)
         cols = [
             ("MMSI", vessel.get("identifier", "") or "-", ""),
             ("SPD", f"{vessel.get('speed', 0):g}", "kn"),
@@ -104,7 +100,7 @@ class LandscapeCompact(LandscapeLayout):
         name = vessel.get("name", "")
         vtype = (vessel.get("ship_type_name") or "vessel").split(" - ", 1)[0].lower()
         vtype = vtype if vtype not in ("", "unknown", "reserved", "other") else "vessel"
-        sub_text = f"A {vtype} passed at {now.strftime('%H:%M')}"
+        sub_text = f"A {vtype} passed at {clock_text('%H:%M')}"
         raw_dest = (vessel.get("destination") or "").strip()
         dest_text = f"Bound for {raw_dest.title()}" if raw_dest else f"In {self._zone_name} waters".title()
 
@@ -128,7 +124,7 @@ class LandscapeCompact(LandscapeLayout):
             cursor += name_adv
         dy = ny + name_block + px(12)
         def dw(t):
-            return f_dest.getbbox(t)[2] - f_dest.getbbox(t)[0]
+            return self._text_width(f_dest, t)
         if dw(dest_text) > left_w:
             while dest_text and dw(dest_text + "…") > left_w:
                 dest_text = dest_text[:-1]
@@ -6,12 +6,10 @@ from a 1600px design width.
 """
 from __future__ import annotations
 
-import datetime
 import math
 
-from PIL import ImageDraw
 from vf_core.marine_utils import compass, fmt_lat, fmt_lon, nav_status_label, range_bearing
-from vf_core.text_utils import FONT_FLOOR
+from vf_core.text_utils import FONT_FLOOR, clock_text
 
 from .landscape_base import LandscapeLayout
 
@@ -114,7 +112,7 @@ class LandscapeLarge(LandscapeLayout):
     async def render(self):
         vessel = self._current_vessel
         canvas = self._renderer.canvas
-        draw = ImageDraw.Draw(canvas)
+        draw = self._draw
         W, H = canvas.size
         self._renderer.clear()
         if vessel is None:
@@ -126,7 +124,6 @@ class LandscapeLarge(LandscapeLayout):
             return max(1, round(v * s))
         am = self._asset_manager
         line = self._palette["line"]
-        now = datetime.datetime.now()
 
         f_brand = am.get_font("secondary", "SemiBold", px(22))
         f_light = am.get_font("secondary", "Regular", px(16))
@@ -146,15 +143,15 @@ class LandscapeLarge(LandscapeLayout):
         y = pad
         self._draw_text(draw, x0, y, "VESSEL FRAME", f_brand)
         self._draw_text(draw, (x0 + x1) // 2, y, "No. 0183", f_light, halign="centre")
-        self._draw_text(draw, x1, y, now.strftime("%d %b %Y · %H:%M"), f_light, halign="right")
+        self._draw_text(draw, x1, y, clock_text("%d %b %Y · %H:%M"), f_light, halign="right")
         y += self._line_height(f_brand) + px(12)
-        draw.line([(x0, y), (x1, y)], line, thin)
+        self._hrule(draw, x0, x1, y, line, thin)
         y += px(28)
 
         # headline: subtitle / name / (flag, dims, draught + identity)
         vtype = (vessel.get("ship_type_name") or "vessel").split(" - ", 1)[0].lower()
         vtype = vtype if vtype not in ("", "unknown", "reserved", "other") else "vessel"
-        self._draw_text(draw, x0, y, f"A {vtype} passed at {now.strftime('%H:%M')}", f_sub)
+        self._draw_text(draw, x0, y, f"A {vtype} passed at {clock_text('%H:%M')}", f_sub)
         y += self._line_height(f_sub) + px(8)
         name = vessel.get("name", "")
         f_name = self._fit_font("primary", "700", name, x1 - x0, max(FONT_FLOOR, px(96)), max(FONT_FLOOR, px(48)))
@@ -165,7 +162,7 @@ class LandscapeLarge(LandscapeLayout):
                  f"   ·   Call sign {(vessel.get('callsign') or '-').strip()}")
         self._draw_text(draw, x1, y, ident, f_info, halign="right")
         y += self._line_height(f_info) + px(20)
-        draw.line([(x0, y), (x1, y)], line, thin)
+        self._hrule(draw, x0, x1, y, line, thin)
         headline_rule_y = y
 
         # data sections at the base
@@ -6,11 +6,8 @@ the foot. Self-sizing from an 800px design width.
 """
 from __future__ import annotations
 
-import datetime
-
-from PIL import ImageDraw
 from vf_core.marine_utils import compass, fmt_lat, fmt_lon, nav_status_label
-from vf_core.text_utils import FONT_FLOOR
+from vf_core.text_utils import FONT_FLOOR, clock_text
 
 from .landscape_base import LandscapeLayout
 
@@ -21,7 +18,7 @@ class LandscapeStandard(LandscapeLayout):
     async def render(self):
         vessel = self._current_vessel
         canvas = self._renderer.canvas
-        draw = ImageDraw.Draw(canvas)
+        draw = self._draw
         W, H = canvas.size
         self._renderer.clear()
         if vessel is None:
@@ -33,7 +30,6 @@ class LandscapeStandard(LandscapeLayout):
             return max(1, round(v * s))
         am = self._asset_manager
         line = self._palette["line"]
-        now = datetime.datetime.now()
 
         f_brand = am.get_font("secondary", "SemiBold", px(14))
         f_light = am.get_font("secondary", "Regular", px(13))
@@ -52,15 +48,15 @@ class LandscapeStandard(LandscapeLayout):
         y = pad
         self._draw_text(draw, x0, y, "VESSEL FRAME", f_brand)
         self._draw_text(draw, (x0 + x1) // 2, y, "No. 0183", f_light, halign="centre")
-        self._draw_text(draw, x1, y, now.strftime("%d %b %Y · %H:%M"), f_light, halign="right")
+        self._draw_text(draw, x1, y, clock_text("%d %b %Y · %H:%M"), f_light, halign="right")
         y += self._line_height(f_brand) + px(8)
-        draw.line([(x0, y), (x1, y)], line, thin)
+        self._hrule(draw, x0, x1, y, line, thin)
         y += px(14)
 
         # subtitle + title
         vtype = (vessel.get("ship_type_name") or "vessel").split(" - ", 1)[0].lower()
         vtype = vtype if vtype not in ("", "unknown", "reserved", "other") else "vessel"
-        self._draw_text(draw, x0, y, f"A {vtype} passed at {now.strftime('%H:%M')}", f_sub)
+        self._draw_text(draw, x0, y, f"A {vtype} passed at {clock_text('%H:%M')}", f_sub)
         y += self._line_height(f_sub) + px(6)
         name = vessel.get("name", "")
         f_name = self._fit_font("primary", "700", name, x1 - x0, max(FONT_FLOOR, px(56)), max(FONT_FLOOR, px(30)))
@@ -69,7 +65,7 @@ class LandscapeStandard(LandscapeLayout):
 
         # bottom strip: dims, draught, MMSI, IMO, callsign, evenly spread
         strip_rule_y = H - pad - px(30)
-        draw.line([(x0, strip_rule_y), (x1, strip_rule_y)], line, thin)
+        self._hrule(draw, x0, x1, strip_rule_y, line, thin)
         v_len = vessel.get("stern", 0) + vessel.get("bow", 0)
         v_wid = vessel.get("port", 0) + vessel.get("starboard", 0)
         items = [f"{v_len}m x {v_wid}m", f"{vessel.get('draught', 0):g}m draught",
@@ -88,7 +84,7 @@ class LandscapeStandard(LandscapeLayout):
         lx0, lx1 = x0, x0 + left_w
         div_x = lx1 + px(20)
         rx0, rx1 = div_x + px(20), x1
-        draw.line([(div_x, body_top), (div_x, body_bot)], line, thin)
+        self._vrule(draw, div_x, body_top, body_bot, line, thin)
 
         # the 7" hero zone is wide, so a horizontal hull always reads best
         self._ls_draw_ship(draw, (lx0, body_top, lx1, body_bot), vessel, "horizontal", px)
@@ -110,8 +106,8 @@ class LandscapeStandard(LandscapeLayout):
             if not unit:
                 self._draw_text(draw, x, yy2, value, f_val, halign=halign)
                 return
-            vw = f_val.getbbox(value)[2] - f_val.getbbox(value)[0]
-            uw = f_valunit.getbbox(unit)[2] - f_valunit.getbbox(unit)[0]
+            vw = self._text_width(f_val, value)
+            uw = self._text_width(f_valunit, unit)
             total = vw + px(3) + uw
             vx = x if halign == "left" else (x - total if halign == "right" else x - total // 2)
             _, bl, _ = self._draw_text(draw, vx, yy2, value, f_val)
@@ -5,9 +5,6 @@ data table on the right.
 """
 from __future__ import annotations
 
-import datetime
-
-from PIL import ImageDraw
 from vf_core.marine_utils import (
     compass,
     compass_full,
@@ -17,7 +14,7 @@ from vf_core.marine_utils import (
     nav_status_label,
     range_bearing,
 )
-from vf_core.text_utils import FONT_FLOOR, split_two
+from vf_core.text_utils import FONT_FLOOR, clock_text, split_two
 
 from .base import ZoneLayout
 
@@ -31,7 +28,7 @@ class PortraitLarge(ZoneLayout):
     async def render(self) -> None:
         vessel = self._current_vessel
         canvas = self._renderer.canvas
-        draw = ImageDraw.Draw(canvas)
+        draw = self._draw
         W, H = canvas.size
         self._renderer.clear()
         if vessel is None:
@@ -44,7 +41,6 @@ class PortraitLarge(ZoneLayout):
         am = self._asset_manager
         P = self._palette
         line = P["line"]
-        now = datetime.datetime.now()
 
         f_brand = am.get_font("secondary", "SemiBold", px(20))
         f_small = am.get_font("secondary", "Regular", px(14))
@@ -75,16 +71,16 @@ class PortraitLarge(ZoneLayout):
         y = margin
         self._draw_text(draw, x0, y, "VESSEL FRAME", f_brand)
         self._draw_text(draw, (x0 + x1) // 2, y, "No. 0183", f_small, halign="centre")
-        self._draw_text(draw, x1, y, now.strftime("%H:%M"), f_small, halign="right")
-        self._draw_text(draw, x1, y + self._line_height(f_small), now.strftime("%d %b %Y"), f_small, halign="right")
+        self._draw_text(draw, x1, y, clock_text("%H:%M"), f_small, halign="right")
+        self._draw_text(draw, x1, y + self._line_height(f_small), clock_text("%d %b %Y"), f_small, halign="right")
         y += max(self._line_height(f_brand), 2 * self._line_height(f_small)) + px(10)
-        draw.line([(x0, y), (x1, y)], line, thick)
+        self._hrule(draw, x0, x1, y, line, thick)
         y += px(24)
 
         # --- subtitle ---
         vtype_raw = (vessel.get("ship_type_name") or "").split(" - ", 1)[0].lower()
         vtype = vtype_raw if vtype_raw not in ("", "unknown", "reserved", "other") else "vessel"
-        self._draw_text(draw, x0, y, f"A {vtype} passed at {now.strftime('%H:%M')}", f_sub)
+        self._draw_text(draw, x0, y, f"A {vtype} passed at {clock_text('%H:%M')}", f_sub)
         y += self._line_height(f_sub) + px(10)
 
         # --- title (split long names, reserve two lines. Centre if a single line) ---
@@ -116,7 +112,7 @@ class PortraitLarge(ZoneLayout):
         y += self._line_height(f_info) + px(20)
 
         # --- full-width rule between title block and body ---
-        draw.line([(x0, y), (x1, y)], line, thin)
+        self._hrule(draw, x0, x1, y, line, thin)
         y += px(26)
         cols_top = y
 
@@ -136,8 +132,8 @@ class PortraitLarge(ZoneLayout):
         diag_rule_y = stats_top - px(18)
         box_bottom = diag_rule_y - px(22)
 
-        draw.line([(lx0, diag_rule_y), (lx1, diag_rule_y)], line, thick)
-        draw.line([(x0, bottom_rule_y), (x1, bottom_rule_y)], line, thin)
+        self._hrule(draw, lx0, lx1, diag_rule_y, line, thick)
+        self._hrule(draw, x0, x1, bottom_rule_y, line, thin)
 
         stats = [("OVERALL LENGTH", f"{v_len}", "m"),
                  ("BEAM", f"{v_wid}", "m"),
@@ -217,13 +213,13 @@ class PortraitLarge(ZoneLayout):
         def section(yy, title):
             self._draw_text(draw, rx0, yy, title, f_sec)
             yy += self._line_height(f_sec) + px(8)
-            draw.line([(rx0, yy), (rx1, yy)], line, thick)
+            self._hrule(draw, rx0, rx1, yy, line, thick)
             return yy + px(18)
 
         def row(yy, label, value, unit, colour, subval, rule=True):
             _, bl, _ = self._draw_text(draw, rx0, yy, label, f_label)
             if unit:
-                uw = f_unit.getbbox(unit)[2] - f_unit.getbbox(unit)[0]
+                uw = self._text_width(f_unit, unit)
                 self._draw_text(draw, rx1 - uw - px(5), yy, value, f_value, halign="right",
                            fill=colour or P["text"], baseline_y=bl)
                 self._draw_text(draw, rx1, yy, unit, f_unit, halign="right", baseline_y=bl)
@@ -236,7 +232,7 @@ class PortraitLarge(ZoneLayout):
                 extra = subval_extra
             yy += row_h + extra
             if rule:
-                draw.line([(rx0, yy - px(9)), (rx1, yy - px(9))], line, thin)
+                self._hrule(draw, rx0, rx1, yy - px(9), line, thin)
             return yy
 
         ry = cols_top
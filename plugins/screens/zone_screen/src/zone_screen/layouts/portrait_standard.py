@@ -8,12 +8,11 @@ since in reality it's Portrait Standard+Compact but it's descriptive enough for
 """
 from __future__ import annotations
 
-import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 from PIL import ImageDraw, ImageFont
 from vf_core.marine_utils import compass, fmt_lat, fmt_lon, mmsi_country, nav_status_label
-from vf_core.text_utils import FONT_FLOOR, split_two
+from vf_core.text_utils import FONT_FLOOR, clock_text, split_two
 
 from .base import ZoneLayout
 
@@ -31,6 +30,50 @@ MIN_SCALE = 0.3
 COMPACT_DIAGRAM_FRACTION = 0.40
 MIN_DIAGRAM_BASE = 80
 
+
+class _ShipGeometry(NamedTuple):
+    """Plan view of the vessel for the diagram, in canvas coordinates."""
+    hull: list[tuple[float, float]]  # pentagon outline, bow to the right
+    mast: tuple[float, float]  # AIS antenna position (the accent dot)
+
+
+def _ship_geometry(stern: int, bow: int, port: int, starboard: int,
+                   x: float, y: float, avail_w: int, avail_h: int) -> _ShipGeometry | None:
+    """Fit the hull, to scale, centred in the avail_w x avail_h box at (x, y).
+
+    Pure arithmetic, kept apart from the drawing. None when either dimension is 0.
+    The scale is kept as the exact ratio num/den: cross-multiplying picks the
+    binding side and the hull size stays in integers, with no float rounding.
+    """
+    ship_len = stern + bow
+    ship_wid = port + starboard
+    if ship_len == 0 or ship_wid == 0:
+        return None
+
+    if avail_w * ship_wid <= avail_h * ship_len:
+        num, den = avail_w, ship_len  # length fills the width
+    else:
+        num, den = avail_h, ship_wid  # beam fills the height
+    scaled_len = ship_len * num // den
+    scaled_wid = ship_wid * num // den
+    centre_x = x + avail_w / 2
+    centre_y = y + avail_h / 2
+
+    nose_len = scaled_len * (0.6 * (scaled_wid / scaled_len))
+    half_len = scaled_len / 2
+    half_wid = scaled_wid / 2
+    hull = [
+        (centre_x - half_len, centre_y - half_wid),
+        (centre_x + half_len - nose_len, centre_y - half_wid),
+        (centre_x + half_len, centre_y),
+        (centre_x + half_len - nose_len, centre_y + half_wid),
+        (centre_x - half_len, centre_y + half_wid),
+    ]
+    mast = ((centre_x - scaled_len / 2) + stern * num / den,
+            (centre_y - scaled_wid / 2) + port * num / den)
+    return _ShipGeometry(hull, mast)
+
+
 # Base font specs (role, variation, size, italic) tuned for REF_W.
 FONT_SPECS = {
     "sec_header":          ("secondary", "Regular",  11, False),
@@ -57,7 +100,7 @@ class PortraitStandard(ZoneLayout):
         self._setup_responsive(*canvas.size)
 
         vessel = self._current_vessel
-        draw = ImageDraw.Draw(canvas)
+        draw = self._draw
         width, height = canvas.size
         lf = self._fonts
 
@@ -73,7 +116,7 @@ class PortraitStandard(ZoneLayout):
         header_h = self._line_height(lf["sec_header_semibold"])
         self._draw_header(draw, (x, y), (right, y + header_h))
         y += header_h + line_w
-        draw.line([(x, y), (right, y)], text_colour, line_w)
+        self._hrule(draw, x, right, y, text_colour, line_w)
         y += line_w
 
         if vessel is None:
@@ -117,17 +160,17 @@ class PortraitStandard(ZoneLayout):
 
         self._draw_title(draw, (x, y), (right, y + title_h), vessel, name_wrap)
         y += title_h + line_w
-        draw.line([(x, y), (right, y)], text_colour, line_w)
+        self._hrule(draw, x, right, y, text_colour, line_w)
         y += line_w
 
         self._draw_vessel_diagram(draw, (x, y), (right, y + diagram_h), vessel)
         y += diagram_h + line_w
-        draw.line([(x, y), (right, y)], text_colour, line_w)
+        self._hrule(draw, x, right, y, text_colour, line_w)
         y += line_w
 
         self._draw_vessel_highlights(draw, (x, y), (right, y + high_h), vessel)
         y += high_h + line_w
-        draw.line([(x, y), (right, y)], text_colour, line_w)
+        self._hrule(draw, x, right, y, text_colour, line_w)
 
         self._draw_vessel_data(draw, (x, footer_top), (right, bottom), vessel)
 
@@ -223,7 +266,7 @@ class PortraitStandard(ZoneLayout):
         draw.text((x0, y), "Vessel Frame", fill=text, font=brand_f)
         brand_w = brand_f.getbbox("Vessel Frame")[2]
 
-        date_text = datetime.datetime.now().strftime("%d %b %Y %H:%M")
+        date_text = clock_text("%d %b %Y %H:%M")
         date_w = light_f.getbbox(date_text)[2]
         date_x = x1 - date_w
         draw.text((date_x, y), date_text, fill=text, font=light_f)
@@ -257,7 +300,7 @@ class PortraitStandard(ZoneLayout):
         if " " not in name:
             return False
         header = self._fonts["pri_header"]
-        if header.getbbox(name)[2] - header.getbbox(name)[0] <= width:
+        if self._text_width(header, name) <= width:
             return False
         shared = flex_space - (self._title_min_h() + self._wrap_extra_h())
         info_min = self._info_core_height(0, width, vessel) + 4 * self._gap_small
@@ -279,7 +322,7 @@ class PortraitStandard(ZoneLayout):
 
         vessel_type_raw = (vessel.get("ship_type_name") or "").split(" - ", 1)[0].lower()
         vessel_type = vessel_type_raw if vessel_type_raw not in ("", "unknown", "reserved", "other") else "vessel"
-        type_text = f"A {vessel_type} passed at {datetime.datetime.now().strftime('%H:%M')}"
+        type_text = f"A {vessel_type} passed at {clock_text('%H:%M')}"
         name_text = vessel.get("name", "")
 
         country = mmsi_country(vessel.get("identifier", ""))
@@ -393,7 +436,7 @@ class PortraitStandard(ZoneLayout):
 
         y = tl[1] + pos_h
         if divider_w:
-            draw.line([(x, y), (right, y)], self._palette["line"], divider_w)
+            self._hrule(draw, x, right, y, self._palette["line"], divider_w)
 
         dest_y = y + divider_w + dest_v_offset
         lower_divider_y = tl[1] + pos_h + divider_w + dest_avail
@@ -401,7 +444,7 @@ class PortraitStandard(ZoneLayout):
 
         y = lower_divider_y
         if divider_w:
-            draw.line([(x, y), (right, y)], self._palette["line"], divider_w)
+            self._hrule(draw, x, right, y, self._palette["line"], divider_w)
 
         y = tl[1] + pos_h + divider_w + dest_avail + divider_w
         self._draw_movement_section(draw, (x, y), (right, y + move_h), vessel)
@@ -490,13 +533,13 @@ class PortraitStandard(ZoneLayout):
 
         speed_str = f"{speed:g}"
         sib, sbl = put(x, val_top, speed_str, lf["pri_title"])
-        sw = lf["pri_title"].getbbox(speed_str)[2] - lf["pri_title"].getbbox(speed_str)[0]
+        sw = self._text_width(lf["pri_title"], speed_str)
         put(x + sw + 2, val_top, "kn", lf["sec_body"], baseline_y=sbl)
 
         course_num = f"{course:g}°"
         course_dir = compass(course)
-        w_num = lf["pri_title"].getbbox(course_num)[2] - lf["pri_title"].getbbox(course_num)[0]
-        w_dir = lf["sec_body"].getbbox(course_dir)[2] - lf["sec_body"].getbbox(course_dir)[0]
+        w_num = self._text_width(lf["pri_title"], course_num)
+        w_dir = self._text_width(lf["sec_body"], course_dir)
         course_x = mid - (w_num + 2 + w_dir) // 2
         cib, cbl = put(course_x, val_top, course_num, lf["pri_title"])
         put(course_x + w_num + 2, val_top, course_dir, lf["sec_body"], baseline_y=cbl)
@@ -589,8 +632,8 @@ class PortraitStandard(ZoneLayout):
 
         course_num = f"{course:g}°"
         course_dir = compass(course)
-        w_num = lf["pri_title"].getbbox(course_num)[2] - lf["pri_title"].getbbox(course_num)[0]
-        w_dir = lf["sec_body"].getbbox(course_dir)[2] - lf["sec_body"].getbbox(course_dir)[0]
+        w_num = self._text_width(lf["pri_title"], course_num)
+        w_dir = self._text_width(lf["sec_body"], course_dir)
         course_x = mid - (w_num + 2 + w_dir) // 2
         _, course_baseline, _ = self._draw_text(draw, course_x, y, course_num, lf["pri_title"])
         self._draw_text(draw, course_x + w_num + 2, y, course_dir, lf["sec_body"], baseline_y=course_baseline)
@@ -633,60 +676,20 @@ class PortraitStandard(ZoneLayout):
         box_width = br[0] - tl[0]
         box_height = br[1] - tl[1]
 
-        ship_stern = vessel.get("stern", 0)
-        ship_bow = vessel.get("bow", 0)
-        ship_port = vessel.get("port", 0)
-        ship_starboard = vessel.get("starboard", 0)
-
-        ship_len = ship_stern + ship_bow
-        ship_wid = ship_port + ship_starboard
-
-        if ship_len == 0 or ship_wid == 0:
-            return
-
         border_padding = self._ship_diagram_padding
-        inner_x = x + border_padding
-        inner_y = y + border_padding
-        inner_width = box_width - border_padding * 2
-        inner_height = box_height - border_padding * 2
-
         ship_padding = self._ship_inner_padding
-        available_width = inner_width - ship_padding * 2
-        available_height = inner_height - ship_padding * 2
-
-        scale_factor = min(available_width / ship_len, available_height / ship_wid)
-        scaled_len = int(ship_len * scale_factor)
-        scaled_wid = int(ship_wid * scale_factor)
-
-        ship_centre_x = inner_x + ship_padding + available_width / 2
-        ship_centre_y = inner_y + ship_padding + available_height / 2
-
-        self._draw_ship_outline(draw, ship_centre_x, ship_centre_y, scaled_len, scaled_wid)
+        inset = border_padding + ship_padding
+        geom = _ship_geometry(
+            vessel.get("stern", 0), vessel.get("bow", 0),
+            vessel.get("port", 0), vessel.get("starboard", 0),
+            x + inset, y + inset,
+            box_width - border_padding * 2 - ship_padding * 2,
+            box_height - border_padding * 2 - ship_padding * 2,
+        )
+        if geom is None:
+            return
 
-        dot_x = (ship_centre_x - scaled_len / 2) + ship_stern * scale_factor
-        dot_y = (ship_centre_y - scaled_wid / 2) + ship_port * scale_factor
+        draw.polygon(geom.hull, outline=self._palette["line"], width=max(1, int(2 * self._scale)))
+        dot_x, dot_y = geom.mast
         r = self._mast_size / 2
         draw.ellipse([dot_x - r, dot_y - r, dot_x + r, dot_y + r], fill=self._palette["accent"])
-
-    def _draw_ship_outline(
-        self,
-        draw: ImageDraw.ImageDraw,
-        centre_x: float,
-        centre_y: float,
-        scaled_len: int,
-        scaled_wid: int,
-    ) -> None:
-        nose_ratio = 0.6 * (scaled_wid / scaled_len)
-        nose_len = scaled_len * nose_ratio
-        half_len = scaled_len / 2
-        half_wid = scaled_wid / 2
-        line_width = max(1, int(2 * self._scale))
-
-        points = [
-            (centre_x - half_len, centre_y - half_wid),
-            (centre_x + half_len - nose_len, centre_y - half_wid),
-            (centre_x + half_len, centre_y),
-            (centre_x + half_len - nose_len, centre_y + half_wid),
-            (centre_x - half_len, centre_y + half_wid),
-        ]
-        draw.polygon(points, outline=self._palette["line"], width=line_width)
@@ -7,19 +7,54 @@ This script runs at boot via systemd to set up the
 network according to the user's preferences.
 """
 
+import fcntl
+import hashlib
 import json
 import logging
+import logging.handlers
+import os
+import select
+import socket
+import stat
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections.abc import Sequence
 from pathlib import Path
 
+# NetworkManager's D-Bus API lets the client-mode wait sleep until the device
+# changes state. Without pydbus (python3-pydbus) it falls back to following nmcli.
+try:
+    from gi.repository import GLib
+    from pydbus import SystemBus
+except ImportError:
+    SystemBus = None
+
+# Address changes go straight over netlink with pyroute2 (python3-pyroute2)
+# when it's installed, and through the ip command otherwise.
+try:
+    from pyroute2 import IPRoute
+except ImportError:
+    IPRoute = None
+
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+
+# The log file isn't opened until the first flush, and records are buffered so
+# early boot doesn't pay for a rootfs write per line. Warnings and errors flush
+# straight away (exit hooks don't run if systemd kills us mid-wait) and
+# logging's exit hook flushes whatever is left.
+log_file = logging.FileHandler('/var/log/vessel-frame-network-mode.log', delay=True)
+log_file.setFormatter(logging.Formatter(LOG_FORMAT))
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+    format=LOG_FORMAT,
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('/var/log/vessel-frame-network-mode.log')
+        logging.handlers.MemoryHandler(64, flushLevel=logging.WARNING, target=log_file)
     ]
 )
 logger = logging.getLogger('vf_network')
@@ -29,39 +64,28 @@ CONFIG_FILE = Path("/etc/vessel-frame/network_config.json")
 HOSTAPD_CONF = "/etc/hostapd/hostapd.conf"
 DNSMASQ_CONF = "/etc/dnsmasq.d/vessel-frame.conf"
 WPA_SUPPLICANT_CONF = "/etc/wpa_supplicant/wpa_supplicant.conf"
+STATE_FILE = Path("/run/vessel-frame/network_mode.state")
 INTERFACE = "wlan0"
 
+NM_BUS_NAME = "org.freedesktop.NetworkManager"
+NM_DEVICE_STATE_ACTIVATED = 100
 
-def load_config() -> dict:
-    """Load network configuration from file"""
-
-    try:
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE) as f:
-                return json.load(f)
-    except Exception as e:
-        logger.error(f"Error loading config: {e}")
-
-    # Default to client mode
-    return {"mode": "client"}
-
+# Interface flags and IPv4 address ioctls, and the flag for a link that's up and usable
+SIOCGIFFLAGS = 0x8913
+SIOCGIFADDR = 0x8915
+IFF_RUNNING = 0x40
 
-def configure_ap_mode(config: dict) -> bool:
-    """Configure the device as an access point"""
+# Link poll fallback: first check after POLL_DELAY_MIN seconds, each wait
+# POLL_BACKOFF times longer than the last, never more than POLL_DELAY_MAX
+POLL_DELAY_MIN = 0.1
+POLL_BACKOFF = 1.5
+POLL_DELAY_MAX = 2.0
 
-    logger.info(f"Configuring AP mode: {config.get('ap_ssid', 'vessel-frame')}")
+# Seconds before the client timeout to write the AP configs for the fallback
+AP_PREPARE_LEAD = 10
 
-    try:
-        # Stop NetworkManager
-        subprocess.run(['systemctl', 'stop', 'NetworkManager'], check=False)
-        subprocess.run(['systemctl', 'stop', 'wpa_supplicant'], check=False)
-
-        # Configure hostapd
-        ap_ssid = config.get('ap_ssid', 'vessel-frame')
-        ap_password = config.get('ap_password', 'spook_workshop')
-        ap_channel = config.get('ap_channel', 6)
-
-        hostapd_config = f"""interface={INTERFACE}
+# Daemon config templates, filled in with str.format_map
+HOSTAPD_TEMPLATE = """interface={interface}
 driver=nl80211
 ssid={ap_ssid}
 hw_mode=g
@@ -77,30 +101,443 @@ wpa_pairwise=TKIP
 rsn_pairwise=CCMP
 """
 
-        with open(HOSTAPD_CONF, 'w') as f:
-            f.write(hostapd_config)
-
-        # Configure dnsmasq
-        ap_ip = config.get('ap_ip', '10.0.0.1')
-        dnsmasq_config = f"""interface={INTERFACE}
+DNSMASQ_TEMPLATE = """interface={interface}
 dhcp-range=10.0.0.2,10.0.0.20,255.255.255.0,24h
 domain=wlan
 address=/vessel-frame.local/{ap_ip}
 address=/vessel-frame/{ap_ip}
 """
 
-        with open(DNSMASQ_CONF, 'w') as f:
-            f.write(dnsmasq_config)
+WPA_SUPPLICANT_TEMPLATE = """ctrl_interface=DIR=/var/run/wpa_supplicant GROUP=netdev
+update_config=1
+country=GB
+
+network={{
+    ssid="{client_ssid}"
+    psk="{client_password}"
+    key_mgmt=WPA-PSK
+}}
+"""
+
+# Units the modes switch between, and the ActiveStates that count as running
+NETWORK_UNITS = ('NetworkManager', 'wpa_supplicant', 'hostapd', 'dnsmasq')
+RUNNING_STATES = ('active', 'activating', 'reloading')
+
+# Units each mode leaves running; all others are stopped
+MODE_UNITS = {
+    'ap': ('hostapd', 'dnsmasq'),
+    'client': ('NetworkManager',),
+    'offline': (),
+}
+
+# Fixed command lines, built once
+IP_BATCH = ('ip', '-batch', '-')
+IP_FLUSH = ('ip', 'addr', 'flush', 'dev', INTERFACE)
+IP_LINK_DOWN = ('ip', 'link', 'set', INTERFACE, 'down')
+NM_MONITOR = ('nmcli', 'device', 'monitor', INTERFACE)
+SHOW_UNIT_STATES = ('systemctl', 'show', '-p', 'ActiveState', *NETWORK_UNITS)
+UNMASK_HOSTAPD = ('systemctl', 'unmask', 'hostapd')
+
+
+def config_digest(config: dict) -> str:
+    """Stable digest of the config, to tell whether it changed since the last run"""
+
+    encoded = json.dumps(config, sort_keys=True).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def already_applied(mode: str, digest: str) -> bool:
+    """True if this boot already applied this exact config and it's still in effect"""
+
+    try:
+        if STATE_FILE.read_text() != f"{mode} {digest}":
+            return False
+    except OSError:
+        return False
+
+    states = unit_states()
+    wanted = MODE_UNITS.get(mode)
+    if not states or wanted is None:
+        return False
+
+    for unit in NETWORK_UNITS:
+        if (unit in wanted) != (states.get(unit) in RUNNING_STATES):
+            return False
+
+    # Client mode is only in effect while the interface is actually connected
+    return mode != 'client' or link_connected()
+
+
+def record_applied(mode: str, digest: str | None) -> None:
+    """Remember the applied config for already_applied, or forget it (digest None)"""
+
+    try:
+        if digest is None:
+            STATE_FILE.unlink(missing_ok=True)
+        else:
+            STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            STATE_FILE.write_text(f"{mode} {digest}")
+    except OSError as e:
+        logger.warning(f"Could not update {STATE_FILE}: {e}")
+
+
+def load_config() -> dict:
+    """Load network configuration from file"""
+
+    try:
+        # One read of the whole (small) file; json.loads takes the bytes as they are
+        return json.loads(CONFIG_FILE.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Error loading config: {e}")
+
+    # Default to client mode
+    return {"mode": "client"}
+
+
+def notify(*states: str) -> None:
+    """Send state lines (READY=1, STATUS=...) to systemd when run as a notify unit"""
+
+    path = os.environ.get('NOTIFY_SOCKET')
+    if not path:
+        return
+
+    # Abstract namespace sockets are advertised with a leading '@'
+    if path.startswith('@'):
+        path = '\0' + path[1:]
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM | socket.SOCK_CLOEXEC) as sock:
+            sock.connect(path)
+            sock.sendall('\n'.join(states).encode())
+    except OSError as e:
+        logger.warning(f"Could not notify systemd: {e}")
+
+
+def write_if_changed(path: str, content: str, mode: int = 0o644) -> bool:
+    """Write content to path unless it already holds exactly that. True if written
+
+    The new content goes to a temporary file alongside, which is synced and then
+    renamed over path, so a daemon starting meanwhile sees the old file or the
+    new one, never a partial write. It has mode from the moment it's created,
+    and an unchanged file is still brought to mode if it differs.
+    """
+
+    try:
+        with open(path) as f:
+            if f.read() == content:
+                if stat.S_IMODE(os.fstat(f.fileno()).st_mode) != mode:
+                    os.fchmod(f.fileno(), mode)
+                return False
+    except FileNotFoundError:
+        pass
+
+    # A leading dot keeps the temporary file out of dnsmasq's conf-dir scan
+    directory, name = os.path.split(path)
+    with tempfile.NamedTemporaryFile(
+        'w', dir=directory, prefix=f'.{name}.', delete=False
+    ) as f:
+        try:
+            os.fchmod(f.fileno(), mode)
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            os.unlink(f.name)
+            raise
+
+    os.replace(f.name, path)
+    return True
+
+
+def spawn(argv: Sequence[str], check: bool = True) -> int:
+    """Run a command that needs no redirected IO and wait for it.
+
+    posix_spawnp avoids the fork path and subprocess's bookkeeping. With
+    check, a non-zero exit raises CalledProcessError as subprocess.run would.
+    """
+
+    pid = os.posix_spawnp(argv[0], argv, os.environ)
+    _, status = os.waitpid(pid, 0)
+    returncode = os.waitstatus_to_exitcode(status)
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, argv)
+    return returncode
+
+
+def set_ap_address(address: str) -> None:
+    """Make address/24 the interface's only address and bring the link up"""
+
+    if IPRoute is None:
+        # One ip process runs the whole sequence over a single netlink socket,
+        # stopping at the first command that fails.
+        subprocess.run(
+            IP_BATCH,
+            input=(
+                f"addr flush dev {INTERFACE}\n"
+                f"addr add {address}/24 dev {INTERFACE}\n"
+                f"link set {INTERFACE} up\n"
+            ),
+            text=True,
+            check=True
+        )
+        return
+
+    with IPRoute() as ipr:
+        index = ipr.link_lookup(ifname=INTERFACE)[0]
+        ipr.flush_addr(index=index)
+        ipr.addr('add', index=index, address=address, prefixlen=24)
+        ipr.link('set', index=index, state='up')
+
+
+def flush_addresses() -> None:
+    """Remove the interface's addresses, ignoring failures"""
+
+    if IPRoute is None:
+        spawn(IP_FLUSH, check=False)
+        return
+
+    try:
+        with IPRoute() as ipr:
+            ipr.flush_addr(index=ipr.link_lookup(ifname=INTERFACE)[0])
+    except Exception as e:
+        logger.warning(f"Could not flush {INTERFACE} addresses: {e}")
+
+
+def set_link_down() -> None:
+    """Bring the interface down, ignoring failures"""
+
+    if IPRoute is None:
+        spawn(IP_LINK_DOWN, check=False)
+        return
+
+    try:
+        with IPRoute() as ipr:
+            ipr.link('set', index=ipr.link_lookup(ifname=INTERFACE)[0], state='down')
+    except Exception as e:
+        logger.warning(f"Could not bring {INTERFACE} down: {e}")
+
+
+def unit_states() -> dict:
+    """ActiveState of each of NETWORK_UNITS from one systemctl call ({} if unknown)"""
+
+    result = subprocess.run(
+        SHOW_UNIT_STATES,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    if result.returncode != 0:
+        return {}
+
+    # One "ActiveState=..." block per unit, separated by blank lines, in argument order
+    blocks = result.stdout.strip().split(b'\n\n')
+    return {
+        unit: block.partition(b'=')[2].strip().decode()
+        for unit, block in zip(NETWORK_UNITS, blocks, strict=False)
+    }
+
+
+def stop_units(states: dict, *units: str) -> None:
+    """Stop whichever of units aren't already stopped, in one systemctl call"""
+
+    running = [unit for unit in units if states.get(unit) not in ('inactive', 'failed')]
+    if running:
+        spawn(['systemctl', 'stop', *running], check=False)
+
+
+def start_units(states: dict, *units: str) -> None:
+    """Start whichever of units aren't already running, in one systemctl call"""
+
+    stopped = [unit for unit in units if states.get(unit) not in RUNNING_STATES]
+    if stopped:
+        spawn(['systemctl', 'start', *stopped], check=True)
+
+
+def link_connected() -> bool:
+    """True once the interface is running and has an IPv4 address.
+
+    That's what NetworkManager activating it amounts to, read straight from
+    the kernel rather than asking nmcli. A default route isn't required, as a
+    network without a gateway is still connected.
+    """
+
+    ifreq = struct.pack('256s', INTERFACE.encode())
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        try:
+            flags_req = fcntl.ioctl(sock, SIOCGIFFLAGS, ifreq)
+            # struct ifreq: 16 byte name, then the flags short
+            (flags,) = struct.unpack_from('H', flags_req, 16)
+            if not flags & IFF_RUNNING:
+                return False
+            # Fails with EADDRNOTAVAIL until DHCP has assigned an address
+            fcntl.ioctl(sock, SIOCGIFADDR, ifreq)
+        except OSError:
+            return False
+    return True
+
+
+def wait_for_connection_dbus(deadline: float) -> bool:
+    """Block on NetworkManager's StateChanged signal until the interface is activated"""
+
+    bus = SystemBus()
+    nm = bus.get(NM_BUS_NAME)
+    device = bus.get(NM_BUS_NAME, nm.GetDeviceByIpIface(INTERFACE))
+    loop = GLib.MainLoop()
+    connected = False
+
+    def on_state_changed(new_state, old_state, reason):
+        nonlocal connected
+        if new_state == NM_DEVICE_STATE_ACTIVATED:
+            connected = True
+            loop.quit()
+
+    # Subscribe before reading the current state so a transition in between isn't missed
+    subscription = device.StateChanged.connect(on_state_changed)
+    try:
+        if device.State == NM_DEVICE_STATE_ACTIVATED:
+            return True
+        remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+        GLib.timeout_add(remaining_ms, loop.quit)
+        loop.run()
+    finally:
+        subscription.disconnect()
+
+    return connected
+
+
+def wait_for_connection_poll(deadline: float) -> bool:
+    """Poll the link until the interface is connected, backing off between checks.
+
+    Starts at POLL_DELAY_MIN and grows to POLL_DELAY_MAX, so a quick connect is
+    seen promptly while a slow one costs few wakeups.
+    """
+
+    delay = POLL_DELAY_MIN
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * POLL_BACKOFF, POLL_DELAY_MAX)
+
+        if link_connected():
+            return True
+
+
+def wait_for_connection_monitor(deadline: float) -> bool:
+    """Follow one long-lived `nmcli device monitor` until the interface is connected.
+
+    Falls back to polling if the monitor exits before the deadline.
+    """
+
+    with subprocess.Popen(
+        NM_MONITOR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=0
+    ) as proc:
+        try:
+            # Monitor first, then read the current state so a change in between isn't missed
+            if link_connected():
+                return True
+
+            pending = b''
+            while (remaining := deadline - time.monotonic()) > 0:
+                ready, _, _ = select.select([proc.stdout], [], [], remaining)
+                if not ready:
+                    return False
+                chunk = os.read(proc.stdout.fileno(), 4096)
+                if not chunk:
+                    logger.warning("nmcli monitor exited early, polling instead")
+                    break
+                # Lines look like "wlan0: connecting (getting IP configuration)"
+                *lines, pending = (pending + chunk).split(b'\n')
+                for line in lines:
+                    _, _, state = line.partition(b':')
+                    if state.strip().startswith(b'connected'):
+                        return True
+            else:
+                return False
+        finally:
+            proc.terminate()
+
+    return wait_for_connection_poll(deadline)
+
+
+def wait_for_connection(timeout: float) -> bool:
+    """Wait up to timeout seconds for NetworkManager to connect the interface"""
+
+    deadline = time.monotonic() + timeout
+    if SystemBus is not None:
+        try:
+            return wait_for_connection_dbus(deadline)
+        except Exception as e:
+            logger.warning(f"D-Bus wait unavailable, using nmcli instead: {e}")
+
+    try:
+        return wait_for_connection_monitor(deadline)
+    except OSError as e:
+        logger.warning(f"nmcli monitor unavailable, polling instead: {e}")
+
+    return wait_for_connection_poll(deadline)
+
+
+def write_ap_configs(config: dict) -> tuple[bool, bool]:
+    """Write the hostapd and dnsmasq configs. Whether each one changed"""
+
+    hostapd_config = HOSTAPD_TEMPLATE.format_map({
+        'interface': INTERFACE,
+        'ap_ssid': config.get('ap_ssid', 'vessel-frame'),
+        'ap_channel': config.get('ap_channel', 6),
+        'ap_password': config.get('ap_password', 'spook_workshop'),
+    })
+    dnsmasq_config = DNSMASQ_TEMPLATE.format_map({
+        'interface': INTERFACE,
+        'ap_ip': config.get('ap_ip', '10.0.0.1'),
+    })
+
+    return (
+        write_if_changed(HOSTAPD_CONF, hostapd_config),
+        write_if_changed(DNSMASQ_CONF, dnsmasq_config),
+    )
+
+
+def prepare_ap_fallback(config: dict) -> None:
+    """Write the AP configs ahead of a likely fallback, so it only has to start daemons"""
+
+    try:
+        write_ap_configs(config)
+    except Exception as e:
+        logger.warning(f"Could not prepare AP configs: {e}")
+
+
+def configure_ap_mode(config: dict) -> bool:
+    """Configure the device as an access point"""
+
+    logger.info(f"Configuring AP mode: {config.get('ap_ssid', 'vessel-frame')}")
+
+    try:
+        # Stop NetworkManager. systemctl takes a list of units and queues them
+        # as one job transaction, so each batch here is a single spawn, and
+        # units already in the wanted state are left out entirely.
+        states = unit_states()
+        stop_units(states, 'NetworkManager', 'wpa_supplicant')
+
+        # Configure hostapd and dnsmasq
+        hostapd_changed, dnsmasq_changed = write_ap_configs(config)
 
         # Configure static IP
-        subprocess.run(['ip', 'addr', 'flush', 'dev', INTERFACE], check=False)
-        subprocess.run(['ip', 'addr', 'add', f'{ap_ip}/24', 'dev', INTERFACE], check=True)
-        subprocess.run(['ip', 'link', 'set', INTERFACE, 'up'], check=True)
+        set_ap_address(config.get('ap_ip', '10.0.0.1'))
 
-        # Start AP services
-        subprocess.run(['systemctl', 'unmask', 'hostapd'], check=False)
-        subprocess.run(['systemctl', 'restart', 'dnsmasq'], check=True)
-        subprocess.run(['systemctl', 'restart', 'hostapd'], check=True)
+        # Start AP services. Only a daemon whose config changed needs a restart,
+        # the others just need to be running (start is a no-op if they are).
+        spawn(UNMASK_HOSTAPD, check=False)
+        units = {'dnsmasq': dnsmasq_changed, 'hostapd': hostapd_changed}
+        restart = [unit for unit, changed in units.items() if changed]
+        if restart:
+            spawn(['systemctl', 'restart', *restart], check=True)
+        start_units(states, *(unit for unit, changed in units.items() if not changed))
 
         logger.info("AP mode configured successfully")
         return True
@@ -125,57 +562,58 @@ def configure_client_mode(config: dict) -> bool:
 
     try:
         # Stop AP services and start NetworkManager
-        subprocess.run(['systemctl', 'stop', 'hostapd'], check=False)
-        subprocess.run(['systemctl', 'stop', 'dnsmasq'], check=False)
+        states = unit_states()
+        stop_units(states, 'hostapd', 'dnsmasq')
 
         # Remove static IP
-        subprocess.run(['ip', 'addr', 'flush', 'dev', INTERFACE], check=False)
+        flush_addresses()
 
         # Start NetworkManager
-        subprocess.run(['systemctl', 'start', 'NetworkManager'], check=True)
+        start_units(states, 'NetworkManager')
 
         # Create wpa_supplicant configuration for NetworkManager
-        wpa_config = f"""ctrl_interface=DIR=/var/run/wpa_supplicant GROUP=netdev
-update_config=1
-country=GB
-
-network={{
-    ssid="{client_ssid}"
-    psk="{client_password}"
-    key_mgmt=WPA-PSK
-}}
-"""
-
-        with open(WPA_SUPPLICANT_CONF, 'w') as f:
-            f.write(wpa_config)
+        wpa_config = WPA_SUPPLICANT_TEMPLATE.format_map({
+            'client_ssid': client_ssid,
+            'client_password': client_password,
+        })
 
-        # Set permissions
-        subprocess.run(['chmod', '600', WPA_SUPPLICANT_CONF], check=True)
+        # Holds the wifi password, so only root may read it
+        write_if_changed(WPA_SUPPLICANT_CONF, wpa_config, mode=0o600)
 
         # Give NetworkManager time to connect
         timeout = config.get('fallback_timeout', 60)
 
+        # Config is in place, so let dependent units start while NetworkManager connects
+        notify('READY=1', f"STATUS=Waiting up to {timeout}s for {client_ssid}")
+
+        # Near the end of the wait a fallback is likely, so get the AP configs
+        # written while still waiting. hostapd and dnsmasq are stopped, so this
+        # doesn't disturb anything, and wpa_supplicant keeps trying meanwhile.
+        prepare = threading.Timer(
+            max(timeout - AP_PREPARE_LEAD, 0), prepare_ap_fallback, (config,)
+        )
+        if auto_fallback:
+            prepare.start()
+
         logger.info(f"Waiting up to {timeout}s for NetworkManager to connect...")
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            time.sleep(1)
-
-            # Check if connected via NetworkManager
-            result = subprocess.run(
-                ['nmcli', '-t', '-f', 'GENERAL.STATE', 'device', 'show', INTERFACE],
-                capture_output=True,
-                text=True
-            )
-
-            if 'connected' in result.stdout.lower():
-                logger.info("Connected to network successfully")
-                return True
+        try:
+            connected = wait_for_connection(timeout)
+        finally:
+            prepare.cancel()
+            if prepare.is_alive():
+                prepare.join()
+
+        if connected:
+            logger.info("Connected to network successfully")
+            notify(f"STATUS=Connected to {client_ssid}")
+            return True
 
         logger.warning(f"Failed to connect within {timeout}s")
 
         # Fall back to AP mode if configured
         if auto_fallback:
             logger.info("Fallback enabled, switching to AP mode")
+            notify("STATUS=Connection timed out, switching to AP mode")
             return configure_ap_mode(config)
 
         return False
@@ -196,11 +634,8 @@ def configure_offline_mode() -> bool:
     logger.info("Configuring offline mode")
 
     try:
-        subprocess.run(['systemctl', 'stop', 'hostapd'], check=False)
-        subprocess.run(['systemctl', 'stop', 'dnsmasq'], check=False)
-        subprocess.run(['systemctl', 'stop', 'NetworkManager'], check=False)
-        subprocess.run(['systemctl', 'stop', 'wpa_supplicant'], check=False)
-        subprocess.run(['ip', 'link', 'set', INTERFACE, 'down'], check=False)
+        stop_units(unit_states(), *NETWORK_UNITS)
+        set_link_down()
 
         logger.info("Offline mode configured successfully")
         return True
@@ -218,6 +653,13 @@ def main():
 
     logger.info(f"Network mode: {mode}")
 
+    # /run is cleared at boot, so this only short-circuits re-runs within a boot
+    digest = config_digest(config)
+    if already_applied(mode, digest):
+        logger.info("Network config unchanged and already applied")
+        notify('READY=1', f"STATUS=Network mode {mode} already applied")
+        return 0
+
     if mode == 'ap':
         success = configure_ap_mode(config)
     elif mode == 'client':
@@ -228,6 +670,11 @@ def main():
         logger.error(f"Unknown mode: {mode}")
         success = False
 
+    record_applied(mode, digest if success else None)
+
+    # Harmless if client mode already signalled readiness
+    notify('READY=1', f"STATUS=Network mode {mode} {'applied' if success else 'failed'}")
+
     if success:
         logger.info("Network config applied successfully")
         return 0
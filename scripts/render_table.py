@@ -63,7 +63,7 @@ class FakeRenderer:
 
 
 class FakeBus:
-    def subscribe(self, topic):
+    def subscribe_batches(self, topic):
         async def _gen():
             if False:
                 yield None
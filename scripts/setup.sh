@@ -125,7 +125,7 @@ systemd services. Proceed?" 18 74 || cancelled
 
 section "Step 1: Installing system dependencies"
 APT_PKGS="python3-dev git curl"
-[ "$INSTALL_NETWORK" = yes ] && APT_PKGS="$APT_PKGS dnsmasq hostapd"
+[ "$INSTALL_NETWORK" = yes ] && APT_PKGS="$APT_PKGS dnsmasq hostapd python3-pydbus python3-pyroute2"
 sudo apt update
 sudo apt install -y $APT_PKGS
 
@@ -259,7 +259,7 @@ After=network-pre.target
 Wants=network-pre.target
 
 [Service]
-Type=oneshot
+Type=notify
 User=root
 ExecStart=/usr/local/bin/vessel-frame-network-mode-service
 RemainAfterExit=yes
@@ -84,3 +84,26 @@ async def test_shutdown_stops_subscribers():
     # The shutdown sentinel should end the receive loop cleanly.
     await asyncio.wait_for(task, timeout=1)
     assert received == []
+
+
+async def test_subscribe_batches_drains_queued_messages():
+    bus = MessageBus()
+    batches = []
+
+    async def consume():
+        async for batch in bus.subscribe_batches("t"):
+            batches.append(batch)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.05)
+
+    # Published back to back, so all three are queued before the subscriber wakes.
+    for i in range(3):
+        await bus.publish("t", i)
+    await asyncio.sleep(0.05)
+    await bus.publish("t", 3)
+    await asyncio.sleep(0.05)
+    await bus.shutdown()
+
+    await asyncio.wait_for(task, timeout=1)
+    assert batches == [[0, 1, 2], [3]]
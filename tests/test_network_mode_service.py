@@ -0,0 +1,86 @@
+import importlib.util
+import os
+import stat
+import subprocess
+from pathlib import Path
+
+import pytest
+
+# The service is a standalone script run by the system python, not a package.
+_spec = importlib.util.spec_from_file_location(
+    "network_mode_service",
+    Path(__file__).resolve().parents[1] / "scripts" / "network_mode_service.py",
+)
+nms = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(nms)
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def _fake_systemctl(monkeypatch, stdout, returncode=0):
+    def run(argv, **kwargs):
+        return subprocess.CompletedProcess(argv, returncode, stdout=stdout)
+    monkeypatch.setattr(nms.subprocess, "run", run)
+
+
+def test_unit_states_parses_one_block_per_unit(monkeypatch):
+    _fake_systemctl(
+        monkeypatch,
+        b"ActiveState=active\n\nActiveState=inactive\n\nActiveState=failed\n\nActiveState=activating\n",
+    )
+    assert nms.unit_states() == {
+        "NetworkManager": "active",
+        "wpa_supplicant": "inactive",
+        "hostapd": "failed",
+        "dnsmasq": "activating",
+    }
+
+
+def test_unit_states_unknown_when_systemctl_fails(monkeypatch):
+    _fake_systemctl(monkeypatch, b"", returncode=1)
+    assert nms.unit_states() == {}
+
+
+def test_write_if_changed_creates_with_mode(tmp_path):
+    path = tmp_path / "wpa_supplicant.conf"
+    assert nms.write_if_changed(str(path), "psk=secret\n", mode=0o600)
+    assert path.read_text() == "psk=secret\n"
+    assert _mode(path) == 0o600
+    assert os.listdir(tmp_path) == ["wpa_supplicant.conf"]
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    path = tmp_path / "hostapd.conf"
+    path.write_text("ssid=frame\n")
+    os.chmod(path, 0o644)
+    before = os.stat(path).st_ino
+    assert not nms.write_if_changed(str(path), "ssid=frame\n")
+    assert os.stat(path).st_ino == before
+
+
+def test_write_if_changed_tightens_unchanged_file(tmp_path):
+    path = tmp_path / "wpa_supplicant.conf"
+    path.write_text("psk=secret\n")
+    os.chmod(path, 0o644)
+    assert not nms.write_if_changed(str(path), "psk=secret\n", mode=0o600)
+    assert _mode(path) == 0o600
+
+
+def test_write_if_changed_replaces_changed_content(tmp_path):
+    path = tmp_path / "vessel-frame.conf"
+    path.write_text("address=/vessel-frame/10.0.0.1\n")
+    assert nms.write_if_changed(str(path), "address=/vessel-frame/10.0.0.9\n")
+    assert path.read_text() == "address=/vessel-frame/10.0.0.9\n"
+    assert _mode(path) == 0o644
+    assert os.listdir(tmp_path) == ["vessel-frame.conf"]
+
+
+@pytest.mark.parametrize("interface, expected", [
+    # Loopback is always running with 127.0.0.1
+    ("lo", True),
+    ("vfnosuch0", False),
+])
+def test_link_connected(monkeypatch, interface, expected):
+    monkeypatch.setattr(nms, "INTERFACE", interface)
+    assert nms.link_connected() is expected
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+import vf_core
+from PIL import Image, ImageChops, ImageDraw
+from vf_core.asset_manager import AssetManager
+from vf_core.text_utils import TextRenderingMixin
+
+
+class _Host(TextRenderingMixin):
+    def __init__(self, asset_manager):
+        self._palette = {"text": "#000000"}
+        self._asset_manager = asset_manager
+
+
+@pytest.fixture(scope="module")
+def host():
+    return _Host(AssetManager(Path(vf_core.__file__).resolve().parent / "assets"))
+
+
+@pytest.mark.parametrize("halign", ["left", "centre", "right"])
+@pytest.mark.parametrize("x, y", [(40, 20), (40.5, 20.25), (97.8, 3.6)])
+def test_draw_text_matches_pil(host, halign, x, y):
+    font = host._asset_manager.get_font("primary", "700", 23)
+    text = "NORD ARCADIA · Wg…"
+    ours = Image.new("RGB", (320, 80), "#88AACC")
+    ref = ours.copy()
+
+    # Twice, so the second call is served from the mask cache.
+    for _ in range(2):
+        host._draw_text(ImageDraw.Draw(ours), x, y, text, font, halign, fill="#C03020")
+    ascent, _ = font.getmetrics()
+    for _ in range(2):
+        ImageDraw.Draw(ref).text((x, y + ascent), text, font=font, fill="#C03020",
+                                 anchor=host._ANCHORS[halign])
+
+    assert ImageChops.difference(ours, ref).getbbox() is None